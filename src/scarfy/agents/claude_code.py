@@ -13,9 +13,13 @@ Claude Code CLIを非同期で実行し、結果を構造化された形式で
 """
 
 import asyncio
+import codecs
 import os
+import stat
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 from datetime import datetime
 
 from ..core.interfaces import Agent
@@ -29,6 +33,20 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+async def _drain(stream: asyncio.StreamReader, sink: List[bytes]) -> None:
+    """ストリームをEOFまで読み取り、sinkに蓄積する。
+
+    改行を含まない長い出力でもStreamReaderの行長制限に掛からないよう、
+    行単位ではなく固定サイズのチャンク単位で読み取ります。
+
+    Args:
+        stream: 読み取るサブプロセスのストリーム
+        sink: 読み取ったバイト列を追加するリスト
+    """
+    while chunk := await stream.read(65536):
+        sink.append(chunk)
+
+
 class ClaudeCodeAgent(Agent):
     """Claude Code CLIを使用してファイル処理を行うエージェント。
 
@@ -86,6 +104,24 @@ class ClaudeCodeAgent(Agent):
         }
     """
 
+    # CLIプロセスのリソース競合を避けるため、process_many()の同時実行数は控えめにする
+    default_concurrency = 2
+
+    # 結果辞書の初期値（process()ごとにコピーして使用する）
+    _RESULT_TEMPLATE: Mapping[str, Any] = MappingProxyType(
+        {
+            "agent": "ClaudeCodeAgent",
+            "action": "claude_code_executed",
+            "prompt_used": None,
+            "file_path": None,
+            "file_size": None,
+            "execution_time": None,
+            "claude_output": None,
+            "success": False,
+            "processing_time": None,
+        }
+    )
+
     def __init__(self) -> None:
         """ClaudeCodeAgentを初期化。
 
@@ -94,6 +130,12 @@ class ClaudeCodeAgent(Agent):
         self.template_engine = TemplateEngine()
         self.file_operations = FileOperations()
         self._mcp_servers_initialized: set[str] = set()  # 初期化済みサーバーを記録
+        self._base_env = os.environ.copy()  # サブプロセス用の環境変数のベース
+        # 設定ごとに組み立て済みのCLI引数（プロンプト以外）
+        self._argv_cache: Dict[
+            Tuple[str, Tuple[str, ...], Tuple[str, ...], bool],
+            Tuple[Tuple[str, ...], Tuple[str, ...]],
+        ] = {}
 
     async def process(self, event: Event, config: Dict[str, Any]) -> Dict[str, Any]:
         """Claude Code CLIでファイルを処理。
@@ -137,17 +179,8 @@ class ClaudeCodeAgent(Agent):
         )
 
         # 基本的な結果辞書を作成
-        result = {
-            "agent": "ClaudeCodeAgent",
-            "action": "claude_code_executed",
-            "prompt_used": None,
-            "file_path": None,
-            "file_size": None,
-            "execution_time": None,
-            "claude_output": None,
-            "success": False,
-            "processing_time": start_time.isoformat(),
-        }
+        result: Dict[str, Any] = dict(self._RESULT_TEMPLATE)
+        result["processing_time"] = start_time.isoformat()
 
         try:
             # MCP サーバーの自動設定（初回実行時のみ）
@@ -162,26 +195,30 @@ class ClaudeCodeAgent(Agent):
                 return result
 
             file_path_obj = Path(file_path)
-            result["file_path"] = str(file_path_obj.absolute())
+            result["file_path"] = os.path.abspath(file_path)
 
-            # ファイルの存在確認
-            if not file_path_obj.exists():
+            # ファイルの存在確認（stat は1回だけ取得して以降の検証で使い回す）
+            try:
+                file_stat = os.stat(file_path)
+            except FileNotFoundError:
                 result["error"] = f"ファイルが存在しません: {file_path}"
                 return result
 
             # ファイルが通常ファイルかチェック
-            if not file_path_obj.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 result["error"] = f"ディレクトリまたは特殊ファイルです: {file_path}"
                 return result
 
             # セキュリティチェック（新しいFileOperationsを使用）
-            security_check = self.file_operations.validate_file(file_path_obj, config)
+            security_check = self.file_operations.validate_file(
+                file_path_obj, config, file_stat
+            )
             if security_check is not True:
                 result["error"] = security_check
                 return result
 
             # プロンプトの取得（ファイルパス情報も含めて処理）
-            prompt = self._get_prompt(event, config, file_path_obj)
+            prompt = await self._get_prompt(event, config, file_path_obj)
             if not prompt:
                 result["error"] = (
                     'プロンプトが設定されていません（config["prompt"]またはevent.data["custom_prompt"]が必要）'
@@ -190,8 +227,7 @@ class ClaudeCodeAgent(Agent):
 
             result["prompt_used"] = prompt
 
-            file_size = file_path_obj.stat().st_size
-            result["file_size"] = file_size  # type: ignore
+            result["file_size"] = file_stat.st_size  # type: ignore
 
             # Claude Code CLI実行
             claude_output, execution_time = await self._execute_claude_code(
@@ -211,7 +247,7 @@ class ClaudeCodeAgent(Agent):
 
         return result
 
-    def _get_prompt(
+    async def _get_prompt(
         self, event: Event, config: Dict[str, Any], file_path_obj: Optional[Path] = None
     ) -> Optional[str]:
         """プロンプトを取得してテンプレート置換を実行。
@@ -240,7 +276,10 @@ class ClaudeCodeAgent(Agent):
         # ファイル内容を読み込み（file_path_objが提供されている場合）
         file_content = None
         if file_path_obj:
-            file_content = self.file_operations.read_file_safe(file_path_obj)
+            # 同期的なファイル読み込みでイベントループを止めないようスレッドで実行
+            file_content = await asyncio.to_thread(
+                self.file_operations.read_file_safe, file_path_obj
+            )
 
         # 出力パス情報を計算
         output_paths = None
@@ -255,6 +294,43 @@ class ClaudeCodeAgent(Agent):
         )
         return self.template_engine.replace_placeholders(prompt_template, context)
 
+    @staticmethod
+    def _build_argv_template(
+        claude_path: str,
+        mcp_servers: Tuple[str, ...],
+        additional_tools: Tuple[str, ...],
+        verbose: bool,
+    ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """プロンプトの前後に置くCLI引数を組み立てる。
+
+        Args:
+            claude_path: Claude Code CLIのパス
+            mcp_servers: 使用するMCPサーバー名
+            additional_tools: 追加で許可するツール名
+            verbose: 詳細出力を有効にするかどうか
+
+        Returns:
+            ("--print" より前の引数, プロンプトより後の引数) のタプル
+        """
+        # setup tools
+        base_tools = ("Edit", "Write", "Read")
+        mcp_tools = MCPToolsManager.get_tools_for_servers(list(mcp_servers))
+        logger.debug("MCP tools: %s", mcp_tools)
+        prefix = (
+            claude_path,
+            "--allowedTools",
+            *base_tools,
+            *mcp_tools,
+            *additional_tools,
+        )
+
+        suffix: Tuple[str, ...] = ()
+        if verbose:
+            # stream-json は大きなファイルでバッファ制限に引っかかるため無効化
+            suffix = ("--verbose", "--output-format", "stream-json")
+
+        return prefix, suffix
+
     async def _execute_claude_code(
         self, prompt: str, file_path: Path, config: Dict[str, Any]
     ) -> tuple[str, float]:
@@ -278,86 +354,105 @@ class ClaudeCodeAgent(Agent):
         full_prompt = prompt
 
         mcp_servers = config.get("mcp_servers", [])
-        cmd_args = [claude_path]
-
-        # setup tools
-        base_tools = ["Edit", "Write", "Read"]
-        mcp_tools = MCPToolsManager.get_tools_for_servers(mcp_servers)
-        logger.debug("MCP tools: %s", mcp_tools)
-        additional_tools = config.get("additional_tools", [])
-        all_tools = base_tools + mcp_tools + additional_tools
-        cmd_args.extend(["--allowedTools"] + all_tools)
+        verbose = bool(config.get("verbose", False))
+
+        # プロンプト以外の引数は設定ごとに一度だけ組み立ててキャッシュする
+        argv_key = (
+            claude_path,
+            tuple(mcp_servers),
+            tuple(config.get("additional_tools", [])),
+            verbose,
+        )
+        argv_template = self._argv_cache.get(argv_key)
+        if argv_template is None:
+            argv_template = self._build_argv_template(*argv_key)
+            self._argv_cache[argv_key] = argv_template
+        prefix, suffix = argv_template
 
         # プロンプトの追加
-        cmd_args.extend(["--print", full_prompt])
-        if config.get("verbose", False):
-            cmd_args.extend(["--verbose"])
-            # stream-json は大きなファイルでバッファ制限に引っかかるため無効化
-            cmd_args.extend(["--output-format", "stream-json"])
+        cmd_args = [*prefix, "--print", full_prompt, *suffix]
 
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         # リアルタイム出力を有効にするかどうか
         show_realtime_output = config.get("show_realtime_output", True)
 
+        subprocess_kwargs: Dict[str, Any] = {
+            "stdout": asyncio.subprocess.PIPE,
+            "stderr": asyncio.subprocess.PIPE,
+        }
         # 環境変数設定（大きなファイル処理対応）
-        env = dict(os.environ)
+        # 変更が不要な場合は env を渡さず、親プロセスの環境をそのまま継承する
         if mcp_servers:
             # Python の I/O エンコーディング設定（大きなファイル処理用）
-            env["PYTHONIOENCODING"] = "utf-8"
-            env["PYTHONUNBUFFERED"] = "1"
+            subprocess_kwargs["env"] = {
+                **self._base_env,
+                "PYTHONIOENCODING": "utf-8",
+                "PYTHONUNBUFFERED": "1",
+            }
 
         # Claude Code CLI実行
-        process = await asyncio.create_subprocess_exec(
-            *cmd_args,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env,
-        )
+        process = await asyncio.create_subprocess_exec(*cmd_args, **subprocess_kwargs)
 
-        claude_output = ""
+        output_parts: List[str] = []
+        stderr_chunks: List[bytes] = []
         try:
             if show_realtime_output:
                 # リアルタイム出力モード
                 logger.info("Claude Code 実行開始")
 
-                # 標準出力をリアルタイムで読み取り
-                while True:
-                    try:
-                        line = await asyncio.wait_for(
-                            process.stdout.readline(), timeout=1.0  # type: ignore
-                        )
-                        if not line:
-                            break
-
-                        decoded_line = line.decode("utf-8", errors="replace")
-                        claude_output += decoded_line
-                        # リアルタイムで出力を表示（空行以外）
-                        stripped_line = decoded_line.rstrip()
+                def _log_lines(lines: List[str]) -> None:
+                    # リアルタイムで出力を表示（空行以外）
+                    for line in lines:
+                        stripped_line = line.rstrip()
                         if stripped_line:
                             logger.debug("Claude Code output: %s", stripped_line)
-                    except asyncio.TimeoutError:
-                        # タイムアウトしてもプロセスが生きていれば続行
-                        if process.returncode is not None:
-                            break
-                        continue
-
-                # プロセスの終了を待つ
-                await asyncio.wait_for(process.wait(), timeout=timeout)
 
-                # stderr も読み取り
-                stderr_output = await process.stderr.read()  # type: ignore
-                stderr = stderr_output.decode("utf-8", errors="replace")
+                async def _pump_stdout() -> None:
+                    # 標準出力をチャンク単位で読み取り、インクリメンタルにデコード
+                    # （マルチバイト文字がチャンク境界で分割されても正しく復元される）
+                    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                    pending: List[str] = []  # 改行がまだ来ていない行の断片
+                    while chunk := await process.stdout.read(65536):  # type: ignore
+                        text = decoder.decode(chunk)
+                        output_parts.append(text)
+                        pending.append(text)
+                        if "\n" in text:
+                            lines = "".join(pending).split("\n")
+                            pending = [lines.pop()]
+                            _log_lines(lines)
+                    text = decoder.decode(b"", final=True)
+                    output_parts.append(text)
+                    pending.append(text)
+                    _log_lines(["".join(pending)])
+
+                # stdout と stderr を並行して読み取り、プロセス終了まで待つ
+                # （stderr のパイプが詰まって子プロセスが停止するのを防ぐ）
+                # タイムアウトは全体に対して1つだけ設定する
+                async with asyncio.timeout(timeout):
+                    await asyncio.gather(
+                        _pump_stdout(),
+                        _drain(process.stderr, stderr_chunks),  # type: ignore
+                        process.wait(),
+                    )
+                claude_output = "".join(output_parts)
 
             else:
-                # 従来の一括出力モード
-                stdout, stderr_bytes = await asyncio.wait_for(
-                    process.communicate(), timeout=timeout
+                # 従来の一括出力モード（stdout と stderr を並行して読み取り）
+                stdout_chunks: List[bytes] = []
+                async with asyncio.timeout(timeout):
+                    await asyncio.gather(
+                        _drain(process.stdout, stdout_chunks),  # type: ignore
+                        _drain(process.stderr, stderr_chunks),  # type: ignore
+                        process.wait(),
+                    )
+                claude_output = b"".join(stdout_chunks).decode(
+                    "utf-8", errors="replace"
                 )
-                claude_output = stdout.decode("utf-8", errors="replace")
-                stderr = stderr_bytes.decode("utf-8", errors="replace")
 
-            execution_time = (datetime.now() - start_time).total_seconds()
+            stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+
+            execution_time = time.monotonic() - start_time
 
             if process.returncode != 0:
                 raise Exception(
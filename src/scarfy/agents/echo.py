@@ -11,6 +11,7 @@ EchoAgentは複雑な処理を行わず、入力イベントデータを
 構造化されたレスポンスにパッケージ化するだけです。
 """
 
+from datetime import datetime
 from typing import Dict, Any
 from ..core.interfaces import Agent
 from ..core.events import Event
@@ -79,8 +80,6 @@ class EchoAgent(Agent):
             >>> print(result["message"])
             "カスタムメッセージ"
         """
-        from datetime import datetime
-
         result = {
             "original_event": {
                 "id": event.id,
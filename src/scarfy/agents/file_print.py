@@ -10,8 +10,14 @@ FilePrintAgentは安全性を考慮し、大きなファイルやバイナリフ
 読み込みを制限します。
 """
 
+import asyncio
+import codecs
+import stat
+import sys
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 from ..core.interfaces import Agent
 from ..core.events import Event
@@ -20,6 +26,33 @@ from ..utils.logger import get_logger
 # モジュールレベルでロガーを定義
 logger = get_logger(__name__)
 
+# バイナリ判定のために先頭から読み込むバイト数
+_SNIFF_SIZE = 4096
+
+# NULバイトを通常の文字として含みうるエンコーディング
+_WIDE_ENCODINGS = ("utf-16", "utf-32")
+
+
+class _BinaryFileError(Exception):
+    """ファイルの先頭にNULバイトが含まれ、バイナリと判定された場合の例外。"""
+
+
+def _read_text_file(file_path: Path, encoding: str) -> str:
+    """ファイルを読み込んでテキストとしてデコードする。
+
+    先頭の数KBにNULバイトが含まれる場合は、全体を読み込む前に
+    バイナリファイルとして _BinaryFileError を送出します。
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(_SNIFF_SIZE)
+        if b"\x00" in head and not codecs.lookup(encoding).name.startswith(
+            _WIDE_ENCODINGS
+        ):
+            raise _BinaryFileError(str(file_path))
+        data = head + f.read()
+    # テキストモードでのopenと同様に改行コードを \n に統一する
+    return data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+
 
 class FilePrintAgent(Agent):
     """新規作成されたファイルの内容を標準出力に表示するエージェント。
@@ -55,6 +88,20 @@ class FilePrintAgent(Agent):
         }
     """
 
+    # 結果辞書の初期値（process()ごとにコピーして使用する）
+    _RESULT_TEMPLATE: Mapping[str, Any] = MappingProxyType(
+        {
+            "agent": "FilePrintAgent",
+            "action": "file_content_displayed",
+            "trigger_action": None,
+            "file_path": None,
+            "file_size": None,
+            "encoding": None,
+            "content_displayed": False,
+            "processing_time": None,
+        }
+    )
+
     async def process(self, event: Event, config: Dict[str, Any]) -> Dict[str, Any]:
         """ファイル作成イベントを処理し、ファイル内容を標準出力に表示。
 
@@ -85,8 +132,6 @@ class FilePrintAgent(Agent):
             >>> print(result["content_displayed"])
             True
         """
-        from datetime import datetime
-
         # 設定値の取得
         max_size = config.get("max_size", 1048576)  # 1MB
         encoding = config.get("encoding", "utf-8")
@@ -94,18 +139,11 @@ class FilePrintAgent(Agent):
         show_size = config.get("show_size", True)
 
         # 基本的な結果辞書を作成
-        result = {
-            "agent": "FilePrintAgent",
-            "action": "file_content_displayed",
-            "trigger_action": event.data.get(
-                "action", "unknown"
-            ),  # どのイベントで呼ばれたかを記録
-            "file_path": None,
-            "file_size": None,
-            "encoding": encoding,
-            "content_displayed": False,
-            "processing_time": datetime.now().isoformat(),
-        }
+        result: Dict[str, Any] = dict(self._RESULT_TEMPLATE)
+        # どのイベントで呼ばれたかを記録
+        result["trigger_action"] = event.data.get("action", "unknown")
+        result["encoding"] = encoding
+        result["processing_time"] = datetime.now().isoformat()
 
         try:
             # イベントデータからファイルパスを取得
@@ -117,18 +155,20 @@ class FilePrintAgent(Agent):
             result["file_path"] = file_path
             file_path_obj = Path(file_path)
 
-            # ファイルの存在確認
-            if not file_path_obj.exists():
+            # ファイルの存在確認（stat はイベントループ外で実行）
+            try:
+                file_stat = await asyncio.to_thread(file_path_obj.stat)
+            except FileNotFoundError:
                 result["error"] = f"ファイルが存在しません: {file_path}"
                 return result
 
             # ファイルが通常ファイルかチェック
-            if not file_path_obj.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 result["error"] = f"ディレクトリまたは特殊ファイルです: {file_path}"
                 return result
 
             # ファイルサイズをチェック
-            file_size = file_path_obj.stat().st_size
+            file_size = file_stat.st_size
             result["file_size"] = file_size
 
             if file_size > max_size:
@@ -137,11 +177,12 @@ class FilePrintAgent(Agent):
                 )
                 return result
 
-            # ファイル内容を読み込み
+            # ファイル内容を読み込み（open・read・closeを1回のスレッド実行にまとめる）
             try:
-                with open(file_path_obj, "r", encoding=encoding) as f:
-                    content = f.read()
-            except UnicodeDecodeError:
+                content = await asyncio.to_thread(
+                    _read_text_file, file_path_obj, encoding
+                )
+            except (UnicodeDecodeError, _BinaryFileError):
                 result["error"] = (
                     f"ファイルを {encoding} エンコーディングで読み込めません（バイナリファイルの可能性）"
                 )
@@ -159,15 +200,16 @@ class FilePrintAgent(Agent):
                 file_size,
             )
 
-            print("=" * 60)
-            print(f"🔔 トリガー: {trigger_action}")
+            # 出力をまとめて1回で書き込む
+            separator = "=" * 60 + "\n"
+            parts = [separator, f"🔔 トリガー: {trigger_action}\n"]
             if show_path:
-                print(f"📄 ファイル: {file_path}")
+                parts.append(f"📄 ファイル: {file_path}\n")
             if show_size:
-                print(f"📊 サイズ: {file_size} バイト")
-            print("=" * 60)
-            print(content)
-            print("=" * 60)
+                parts.append(f"📊 サイズ: {file_size} バイト\n")
+            parts.extend([separator, content, "\n", separator])
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
 
             result["content_displayed"] = True
 
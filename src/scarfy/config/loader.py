@@ -4,11 +4,47 @@
 環境変数の展開（~/や$HOME）もサポートします。
 """
 
+import asyncio
+import copy
+import functools
 import os
+import re
 from pathlib import Path
 from typing import Dict, Any
 import yaml
 
+# libyaml が利用可能な場合はC実装のローダーを使用する
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - libyaml なしでビルドされた PyYAML
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# $VAR または ${VAR} 形式の環境変数参照（os.path.expandvars と同じ規則）
+_ENV_VAR_RE = re.compile(r"\$(\w+|\{[^}]*\})", re.ASCII)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """YAMLファイルを読み込んでパースする（パス・mtime・サイズでキャッシュ）。
+
+    mtime_ns と size はキャッシュキーとしてのみ使用され、ファイルが更新されると
+    別のキーになるため自動的に再読み込みされます。
+    """
+    content = Path(path_str).read_text(encoding="utf-8")
+    result = yaml.load(content, Loader=SafeLoader)
+
+    # yaml.load は None や基本型も返す可能性があるので、辞書であることを保証
+    if not isinstance(result, dict):
+        return {}
+
+    return result
+
+
+@functools.lru_cache(maxsize=128)
+def _read_text_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """テキストファイルを読み込む（パス・mtime・サイズでキャッシュ）。"""
+    return Path(path_str).read_text(encoding="utf-8")
+
 
 class ConfigLoader:
     """設定ファイルとプロンプトの読み込み機能を提供するクラス。"""
@@ -26,12 +62,25 @@ class ConfigLoader:
             FileNotFoundError: ファイルが存在しない場合
             UnicodeDecodeError: ファイルのエンコーディングが不正な場合
         """
-        if not prompt_path.exists():
+        try:
+            st = prompt_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"プロンプトファイルが見つかりません: {prompt_path}"
-            )
+            ) from None
+
+        return _read_text_cached(str(prompt_path), st.st_mtime_ns, st.st_size)
 
-        return prompt_path.read_text(encoding="utf-8")
+    async def load_prompt_from_file_async(self, prompt_path: Path) -> str:
+        """load_prompt_from_file をスレッドで実行する非同期版。
+
+        Args:
+            prompt_path: 読み込むプロンプトファイルのパス
+
+        Returns:
+            プロンプトファイルの内容
+        """
+        return await asyncio.to_thread(self.load_prompt_from_file, prompt_path)
 
     def load_config(self, config_path: Path) -> Dict[str, Any]:
         """YAML設定ファイルを読み込み、設定辞書として返す。
@@ -46,17 +95,30 @@ class ConfigLoader:
             FileNotFoundError: ファイルが存在しない場合
             yaml.YAMLError: YAML形式が不正な場合
         """
-        if not config_path.exists():
-            raise FileNotFoundError(f"設定ファイルが見つかりません: {config_path}")
+        try:
+            st = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"設定ファイルが見つかりません: {config_path}"
+            ) from None
+
+        result = _parse_yaml_cached(str(config_path), st.st_mtime_ns, st.st_size)
 
-        content = config_path.read_text(encoding="utf-8")
-        result = yaml.safe_load(content)
+        # キャッシュされた辞書を呼び出し元が変更しないようにコピーして返す
+        return copy.deepcopy(result)
 
-        # yaml.safe_load は None や基本型も返す可能性があるので、辞書であることを保証
-        if not isinstance(result, dict):
-            return {}
+    async def load_config_async(self, config_path: Path) -> Dict[str, Any]:
+        """load_config をスレッドで実行する非同期版。
+
+        イベントループ上からの呼び出しでYAMLのパースがループを止めないようにします。
+
+        Args:
+            config_path: 読み込む設定ファイルのパス
 
-        return result
+        Returns:
+            設定内容の辞書
+        """
+        return await asyncio.to_thread(self.load_config, config_path)
 
     def expand_env_vars(self, text: str) -> str:
         """文字列内の環境変数を展開する（~/や$HOME等）。
@@ -69,7 +131,18 @@ class ConfigLoader:
         """
         # ~ を $HOME に展開
         if text.startswith("~"):
-            text = text.replace("~", os.path.expanduser("~"), 1)
+            text = os.path.expanduser("~") + text[1:]
+
+        # $変数を環境変数に展開（存在しない変数はそのまま残す）
+        if "$" not in text:
+            return text
+
+        environ = os.environ
+
+        def replace_var(match: "re.Match[str]") -> str:
+            name = match.group(1)
+            if name.startswith("{"):
+                name = name[1:-1]
+            return environ.get(name, match.group(0))
 
-        # $変数を環境変数に展開
-        return os.path.expandvars(text)
+        return _ENV_VAR_RE.sub(replace_var, text)
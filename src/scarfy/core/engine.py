@@ -10,8 +10,7 @@
 """
 
 import asyncio
-import copy
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Awaitable, Callable
 from .events import EventBus, Event
 from .interfaces import Trigger, Agent, Output
 from ..utils.logger import get_logger
@@ -57,11 +56,21 @@ class Workflow:
             trigger_config: トリガーコンポーネントの設定
             agent_config: エージェントコンポーネントの設定
             output_config: 出力コンポーネントの設定
+
+        Note:
+            各設定は浅いコピーで保持されます。渡した辞書のネストした値
+            （リストなど）はワークフロー作成後に変更しないでください。
         """
         self.name = name
-        self.trigger_config = copy.deepcopy(trigger_config)
-        self.agent_config = copy.deepcopy(agent_config)
-        self.output_config = copy.deepcopy(output_config)
+        self.trigger_config = dict(trigger_config)
+        self.agent_config = dict(agent_config)
+        self.output_config = dict(output_config)
+        # ScarfyEngineが登録済みコンポーネントから解決して設定する
+        self._agent: Optional[Agent] = None
+        self._output: Optional[Output] = None
+        # ScarfyEngineがイベントの振り分けに使用する（購読中のイベントタイプとコールバック）
+        self._event_type: Optional[str] = None
+        self._callback: Optional[Callable[[Event], Awaitable[None]]] = None
 
 
 class ScarfyEngine:
@@ -96,17 +105,34 @@ class ScarfyEngine:
         >>> await engine.start()
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_concurrent_workflows: int = 256) -> None:
         """Initialize a new ScarfyEngine instance.
 
         Creates the event bus and initializes component registries.
         The engine starts in a stopped state.
+
+        Args:
+            max_concurrent_workflows: Maximum number of workflow runs that may
+                process events at the same time. The same number also caps the
+                event bus's in-flight dispatches, so once it is reached
+                triggers wait in publish() instead of queueing more tasks.
+                This bounds memory under bursty triggers at the cost of peak
+                throughput and of slowing the producers.
         """
-        self.event_bus = EventBus()
+        self.event_bus = EventBus(max_pending=max_concurrent_workflows)
         self.triggers: Dict[str, Trigger] = {}
         self.agents: Dict[str, Agent] = {}
         self.outputs: Dict[str, Output] = {}
         self.workflows: List[Workflow] = []
+        # Workflows and the trigger config to start with, per trigger type
+        self._workflows_by_trigger: Dict[str, List[Workflow]] = {}
+        self._trigger_configs: Dict[str, Dict[str, Any]] = {}
+        # Workflow callbacks per event type (one event bus subscription each)
+        self._workflow_callbacks: Dict[
+            str, List[Callable[[Event], Awaitable[None]]]
+        ] = {}
+        # Bounds concurrent workflow runs across all event types
+        self._workflow_semaphore = asyncio.Semaphore(max_concurrent_workflows)
         self._running = False
 
     def register_trigger(self, name: str, trigger: Trigger) -> None:
@@ -120,6 +146,7 @@ class ScarfyEngine:
             >>> engine.register_trigger("file_watcher", FileWatcherTrigger())
         """
         self.triggers[name] = trigger
+        self._bind_workflows()
 
     def register_agent(self, name: str, agent: Agent) -> None:
         """Register an agent implementation.
@@ -132,6 +159,7 @@ class ScarfyEngine:
             >>> engine.register_agent("llm_processor", ClaudeAgent())
         """
         self.agents[name] = agent
+        self._bind_workflows()
 
     def register_output(self, name: str, output: Output) -> None:
         """Register an output implementation.
@@ -144,6 +172,7 @@ class ScarfyEngine:
             >>> engine.register_output("slack", SlackOutput())
         """
         self.outputs[name] = output
+        self._bind_workflows()
 
     def add_workflow(self, workflow: Workflow) -> None:
         """Add a workflow to the engine.
@@ -155,19 +184,120 @@ class ScarfyEngine:
             workflow: Workflow instance to add
 
         Note:
-            The workflow's trigger must already be registered with the engine
-            before adding the workflow.
+            Components may be registered before or after the workflow is
+            added; the workflow is re-bound on each registration.
         """
         self.workflows.append(workflow)
+        self._bind_components(workflow)
+
+        # Index by trigger type so start() launches each trigger exactly once
+        trigger_type = workflow.trigger_config.get("type")
+        if trigger_type:
+            self._workflows_by_trigger.setdefault(trigger_type, []).append(workflow)
+            # The first workflow's trigger config is used to start the trigger
+            self._trigger_configs.setdefault(trigger_type, workflow.trigger_config)
+
+        # Route events for this workflow
+        workflow._callback = self._make_workflow_callback(workflow)
+        self._route_workflow(workflow)
 
-        # Subscribe to events for this workflow
-        event_type = workflow.trigger_config.get("event_type", "default")
+    def _route_workflow(self, workflow: Workflow) -> None:
+        """Subscribe the workflow's callback under its resolved event type.
+
+        Workflows sharing an event type share a single event bus subscription.
+        When no event type is configured, the event type the trigger publishes
+        is used; if the trigger is registered later, the workflow is moved to
+        that trigger's event type.
+
+        Args:
+            workflow: Workflow whose callback should be routed
+        """
+        event_type = workflow.trigger_config.get("event_type")
+        if event_type is None:
+            # Use the event type the trigger publishes when none is configured
+            trigger_type = workflow.trigger_config.get("type")
+            trigger = self.triggers.get(trigger_type) if trigger_type else None
+            event_type = (trigger or Trigger).default_event_type
+
+        callback = workflow._callback
+        if callback is None or event_type == workflow._event_type:
+            return
+
+        if workflow._event_type is not None:
+            self._workflow_callbacks[workflow._event_type].remove(callback)
+        workflow._event_type = event_type
+
+        callbacks = self._workflow_callbacks.get(event_type)
+        if callbacks is None:
+            callbacks = self._workflow_callbacks[event_type] = []
+            self.event_bus.subscribe(
+                event_type, self._make_event_type_dispatcher(callbacks)
+            )
+        callbacks.append(callback)
+
+    @staticmethod
+    def _make_event_type_dispatcher(
+        callbacks: List[Callable[[Event], Awaitable[None]]],
+    ) -> Callable[[Event], Awaitable[None]]:
+        """Build the single event bus callback for one event type.
+
+        Args:
+            callbacks: Workflow callbacks for the event type. Workflows added
+                later are appended to the same list.
+
+        Returns:
+            Async callback that runs every workflow for the event
+        """
+
+        async def dispatch(event: Event) -> None:
+            if len(callbacks) == 1:
+                await callbacks[0](event)
+                return
+            # Workflow callbacks log their own errors; run them concurrently
+            await asyncio.gather(
+                *(callback(event) for callback in callbacks), return_exceptions=True
+            )
+
+        return dispatch
+
+    def _make_workflow_callback(
+        self, workflow: Workflow
+    ) -> Callable[[Event], Awaitable[None]]:
+        """Build the event callback that runs a workflow.
+
+        Args:
+            workflow: Workflow to build the callback for
+
+        Returns:
+            Async callback to subscribe on the event bus
+        """
 
-        # Create a proper async callback that awaits the workflow processing
         async def workflow_callback(event: Event) -> None:
             await self._process_workflow(workflow, event)
 
-        self.event_bus.subscribe(event_type, workflow_callback)
+        return workflow_callback
+
+    def _bind_components(self, workflow: Workflow) -> None:
+        """Resolve the workflow's agent and output from the registries.
+
+        The resolved instances are cached on the workflow so that event
+        dispatch does not need to look them up on every event.
+
+        Args:
+            workflow: Workflow whose components should be resolved
+        """
+        workflow._agent = self.agents.get(workflow.agent_config.get("type", ""))
+        workflow._output = self.outputs.get(workflow.output_config.get("type", ""))
+
+    def _bind_workflows(self) -> None:
+        """Re-resolve components and event routing for all workflows.
+
+        Called after a registration change so that workflows added before
+        their components were registered pick them up.
+        """
+        for workflow in self.workflows:
+            self._bind_components(workflow)
+            self._route_workflow(workflow)
 
     async def start(self) -> None:
         """Start the engine and all configured workflows.
@@ -188,24 +318,15 @@ class ScarfyEngine:
         # Start event bus
         event_bus_task = asyncio.create_task(self.event_bus.start())
 
-        # Start all triggers used by workflows
-        started_triggers = set()  # Avoid starting same trigger multiple times
-
-        for workflow in self.workflows:
-            trigger_type = workflow.trigger_config.get("type")
-            if not trigger_type:
-                continue
-
+        # Start each trigger type used by workflows exactly once
+        for trigger_type, workflows in self._workflows_by_trigger.items():
             if trigger_type not in self.triggers:
                 raise ValueError(
-                    f"Trigger '{trigger_type}' not registered for workflow '{workflow.name}'"
+                    f"Trigger '{trigger_type}' not registered for workflow '{workflows[0].name}'"
                 )
 
-            # Only start each trigger type once, even if multiple workflows use it
-            if trigger_type not in started_triggers:
-                trigger = self.triggers[trigger_type]
-                await trigger.start(self.event_bus, workflow.trigger_config)
-                started_triggers.add(trigger_type)
+            trigger = self.triggers[trigger_type]
+            await trigger.start(self.event_bus, self._trigger_configs[trigger_type])
 
         # Wait for event bus (this blocks until stop() is called)
         await event_bus_task
@@ -239,38 +360,40 @@ class ScarfyEngine:
         3. Sends the result to the configured output
 
         Errors in individual workflows are caught and logged to prevent
-        one failing workflow from affecting others.
+        one failing workflow from affecting others. Each run holds a slot of
+        the engine's workflow semaphore, so at most max_concurrent_workflows
+        runs process events at the same time.
 
         Args:
             workflow: The workflow configuration to execute
             event: The triggering event to process
         """
-        try:
-            # Get the configured agent
-            agent_type = workflow.agent_config.get("type")
-            if not agent_type or agent_type not in self.agents:
-                logger.error(
-                    "Agent '%s' not found for workflow '%s'", agent_type, workflow.name
-                )
-                return
-
-            agent = self.agents[agent_type]
-
-            # Process the event with the agent
-            result = await agent.process(event, workflow.agent_config)
-
-            # Send result to the configured output
-            output_type = workflow.output_config.get("type")
-            if output_type and output_type in self.outputs:
-                output = self.outputs[output_type]
-                await output.send(result, workflow.output_config)
-            else:
-                logger.error(
-                    "Output '%s' not found for workflow '%s'",
-                    output_type,
-                    workflow.name,
-                )
-
-        except Exception as e:
-            # Log error but don't let it crash other workflows
-            logger.error("Error processing workflow '%s': %s", workflow.name, str(e))
+        async with self._workflow_semaphore:
+            try:
+                # Get the configured agent (resolved when the workflow was added)
+                agent = workflow._agent
+                if agent is None:
+                    logger.error(
+                        "Agent '%s' not found for workflow '%s'",
+                        workflow.agent_config.get("type"),
+                        workflow.name,
+                    )
+                    return
+
+                # Process the event with the agent
+                result = await agent.process(event, workflow.agent_config)
+
+                # Send result to the configured output
+                output = workflow._output
+                if output is not None:
+                    await output.send(result, workflow.output_config)
+                else:
+                    logger.error(
+                        "Output '%s' not found for workflow '%s'",
+                        workflow.output_config.get("type"),
+                        workflow.name,
+                    )
+
+            except Exception as e:
+                # Log error but don't let it crash other workflows
+                logger.error("Error processing workflow '%s': %s", workflow.name, e)
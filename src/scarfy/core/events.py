@@ -10,14 +10,54 @@
 """
 
 import asyncio
-import copy
-from typing import Any, Dict, Callable, Union, Optional
+import bisect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Callable, Coroutine, Set, Tuple, Union, Optional
+import dataclasses
 from dataclasses import dataclass
 from datetime import datetime
+import itertools
 import uuid
 
+from ..utils.logger import get_logger
 
-@dataclass
+# モジュールレベルでロガーを定義
+logger = get_logger(__name__)
+
+# 自動生成するイベントIDのプロセスごとのプレフィックスと連番カウンタ
+# （イベントごとに uuid4 を生成するコストを避ける）
+_ID_PREFIX = uuid.uuid4().hex[:12]
+_ID_COUNTER = itertools.count()
+
+# すべてのイベントタイプを購読するための特別なイベントタイプ
+WILDCARD_EVENT_TYPE = "*"
+
+# 購読者エントリ: (優先度, 購読順の連番, コールバック, コルーチン関数かどうか)
+# 優先度と連番で比較されるため、タプルの並びがそのまま呼び出し順になる
+_Subscriber = Tuple[int, int, Callable[["Event"], Any], bool]
+
+# Python 3.12以降で利用可能な eager タスクファクトリ（3.11では None）
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+
+def _create_dispatch_task(
+    coro: Coroutine[Any, Any, None], eager: bool = False
+) -> "asyncio.Task[None]":
+    """イベントディスパッチ用のタスクを作成します。
+
+    eager が True で eager タスクファクトリが利用可能な場合は、最初の中断ポイントまで
+    コルーチンを呼び出し元で即座に実行し、すぐに完了する購読者のスケジューリングを
+    省きます。イベントループ全体のタスクファクトリは変更しません。
+    """
+    if eager and _eager_task_factory is not None:
+        task: "asyncio.Task[None]" = _eager_task_factory(
+            asyncio.get_running_loop(), coro
+        )
+        return task
+    return asyncio.create_task(coro)
+
+
+@dataclass(slots=True)
 class Event:
     """Scarfyシステム内の単一イベントを表現します。
 
@@ -26,7 +66,8 @@ class Event:
     データを受け渡すために使用されます。
 
     属性:
-        id: このイベントの一意識別子。未提供の場合は自動生成されます。
+        id: このイベントの一意識別子。未提供の場合はプロセス固有のプレフィックスと
+            連番から自動生成されます。
         type: 購読者へのルーティングに使用されるイベントタイプ識別子。
         data: このイベントに関連付けられた任意のデータペイロード。
         timestamp: このイベントが作成された時刻。未提供の場合は自動設定されます。
@@ -40,7 +81,7 @@ class Event:
         ...     timestamp=None,
         ...     source="file_watcher"
         ... )
-        >>> print(event.id)  # 自動生成されたUUID
+        >>> print(event.id)  # 自動生成されたID（例: "3f2a9c1e7b40-0"）
     """
 
     id: str
@@ -54,14 +95,32 @@ class Event:
 
         提供されなかった場合のidとtimestampのデフォルト値を設定します。
         これにより、呼び出し元は自動生成のために空文字列/Noneを渡すことができます。
-        データはイミュータブルにするためにディープコピーされます。
+        データは浅いコピーで保持されるため、呼び出し元は渡した辞書の
+        ネストした値をイベント作成後に変更しないでください。
         """
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = f"{_ID_PREFIX}-{next(_ID_COUNTER)}"
         if self.timestamp is None:
             self.timestamp = datetime.now()
-        # イミュータブルデータ構造を保証するためにdataをディープコピー
-        object.__setattr__(self, "data", copy.deepcopy(self.data))
+        # 呼び出し元の辞書への追加・削除が影響しないようにdataを浅くコピー
+        object.__setattr__(self, "data", dict(self.data))
+
+    def with_data(self, data: Dict[str, Any]) -> "Event":
+        """dataだけを差し替えた新しいEventを返します。
+
+        id、type、timestamp、sourceはこのイベントのものを引き継ぎます。
+        イベントのdataを直接変更する代わりに使用してください。
+
+        Args:
+            data: 新しいイベントのデータペイロード。
+
+        Returns:
+            dataが差し替えられた新しいEventインスタンス。
+
+        例:
+            >>> enriched = event.with_data({**event.data, "size": 42})
+        """
+        return dataclasses.replace(self, data=data)
 
 
 class EventBus:
@@ -94,21 +153,50 @@ class EventBus:
         >>> await bus.publish(event)
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, max_pending: Optional[int] = None, eager_dispatch: bool = False
+    ) -> None:
         """新しいEventBusインスタンスを初期化します。
 
-        イベントのキューイングと購読者の追跡のための内部データ構造を作成します。
+        購読者の追跡と実行中のディスパッチタスクのための内部データ構造を作成します。
         バスは停止状態で作成されます。
+
+        Args:
+            max_pending: 同時に存在できるディスパッチタスクの最大数。上限に達すると
+                publish()は空きができるまで待機し、パブリッシャーの速度を抑えます。
+                None の場合は無制限です。上限を設定する場合、購読者の中から
+                publish()を待機すると空きが出ずに停止する可能性があります。
+            eager_dispatch: True の場合、Python 3.12以降では購読者を publish() の中で
+                最初の中断ポイントまで実行します。すぐに完了する購読者のタスク
+                スケジューリングを省けますが、同期処理の重い購読者があると
+                publish() の呼び出し元がその間ブロックされます。
         """
-        self._queue: asyncio.Queue[Event] = asyncio.Queue()
-        self._subscribers: Dict[str, list] = {}
+        # イベントタイプごとの購読者エントリのタプル（呼び出し順に整列済み）
+        # 購読時に新しいタプルへ置き換えるため、ディスパッチ中に変更されることはない
+        self._subscribers: Dict[str, Tuple[_Subscriber, ...]] = {}
+        # "*" で購読された全イベント対象の購読者（タイプ別とは別に保持）
+        self._wildcard_subscribers: Tuple[_Subscriber, ...] = ()
+        # 同じ優先度の購読者を購読順に並べるための連番
+        self._subscribe_seq = itertools.count()
         self._running = False
+        self._stop_event = asyncio.Event()
+        # 実行中のディスパッチタスク（GCで破棄されないよう参照を保持）
+        self._pending: Set["asyncio.Task[None]"] = set()
+        # ディスパッチタスク数の上限（None の場合は無制限）
+        self._pending_slots: Optional[asyncio.Semaphore] = (
+            asyncio.Semaphore(max_pending) if max_pending is not None else None
+        )
+        self._eager_dispatch = eager_dispatch
+        # 同期コールバック用のスレッドプール（最初の同期コールバック実行時に作成）
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     async def publish(self, event: Event) -> None:
         """処理のためにイベントをバスにパブリッシュします。
 
-        イベントは非同期処理のためにキューに入れられます。このメソッドは
-        購読者がイベントを処理するのを待たずに即座に戻ります。
+        イベントは購読者へのディスパッチタスクとして直接スケジュールされます。
+        このメソッドは購読者がイベントを処理するのを待たずに戻ります。
+        max_pending を設定した場合は、ディスパッチタスク数が上限未満になるまで待機します。
+        eager_dispatch を有効にした場合は、購読者が最初に中断するまで戻りません。
 
         Args:
             event: パブリッシュするEventインスタンス。
@@ -118,10 +206,25 @@ class EventBus:
             ...               timestamp=None, source="test")
             >>> await bus.publish(event)
         """
-        await self._queue.put(event)
+        if not self._subscribers.get(event.type) and not self._wildcard_subscribers:
+            return
+        if self._pending_slots is not None:
+            await self._pending_slots.acquire()
+        task = _create_dispatch_task(self._process_event(event), self._eager_dispatch)
+        self._pending.add(task)
+        task.add_done_callback(self._dispatch_done)
+
+    def _dispatch_done(self, task: "asyncio.Task[None]") -> None:
+        """完了したディスパッチタスクを破棄し、上限の空きを戻します。"""
+        self._pending.discard(task)
+        if self._pending_slots is not None:
+            self._pending_slots.release()
 
     def subscribe(
-        self, event_type: str, callback: Callable[[Event], Union[None, Any]]
+        self,
+        event_type: str,
+        callback: Callable[[Event], Union[None, Any]],
+        priority: int = 0,
     ) -> None:
         """特定のタイプのイベントを購読します。
 
@@ -131,8 +234,13 @@ class EventBus:
 
         Args:
             event_type: 購読するイベントタイプ（Event.typeと一致）。
+                       "*" を指定するとすべてのイベントを購読します。
             callback: 一致するイベントがパブリッシュされたときに呼び出す関数。
                      同期でも非同期でも可能。
+            priority: 呼び出し順の優先度。値が小さい購読者から順に呼び出されます。
+                     同じ優先度の場合は購読順です。順序は購読時に確定するため、
+                     イベントごとの並べ替えは発生しません。
+                     ワイルドカード購読者はタイプ別の購読者の後に呼び出されます。
 
         例:
             >>> def sync_handler(event):
@@ -144,18 +252,32 @@ class EventBus:
             >>> bus.subscribe("test_event", sync_handler)
             >>> bus.subscribe("test_event", async_handler)
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+        # コルーチン関数かどうかは購読時に一度だけ判定しておく
+        entry: _Subscriber = (
+            priority,
+            next(self._subscribe_seq),
+            callback,
+            asyncio.iscoroutinefunction(callback),
+        )
+        if event_type == WILDCARD_EVENT_TYPE:
+            current = self._wildcard_subscribers
+        else:
+            current = self._subscribers.get(event_type, ())
+        # 連番は一意なので、比較がコールバックに及ぶことはない
+        entries = list(current)
+        bisect.insort(entries, entry)
+        if event_type == WILDCARD_EVENT_TYPE:
+            self._wildcard_subscribers = tuple(entries)
+        else:
+            self._subscribers[event_type] = tuple(entries)
 
     async def start(self) -> None:
-        """イベント処理ループを開始します。
+        """イベントバスを開始し、stop()が呼ばれるまで待機します。
 
-        これは無期限に実行され、キューからイベントを処理して
-        購読者にルーティングします。通常はバックグラウンドタスクとして実行されます。
+        イベントはpublish()の時点で購読者にディスパッチされるため、このメソッドは
+        バスの実行状態を管理するだけです。通常はバックグラウンドタスクとして実行されます。
 
-        ループはstop()が呼ばれるまで継続します。イベントは実行フラグの定期チェックを
-        可能にするため1秒のタイムアウトで処理されます。
+        stop()が呼ばれると即座に戻ります。
 
         例:
             >>> # バックグラウンドで処理開始
@@ -168,53 +290,98 @@ class EventBus:
             >>> await processing_task
         """
         self._running = True
-        while self._running:
-            try:
-                event = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-                await self._process_event(event)
-            except asyncio.TimeoutError:
-                # Timeout allows us to check _running flag periodically
-                continue
-            except Exception:
-                # Log error in production code, but continue processing
-                continue
+        self._stop_event.clear()
+        try:
+            await self._stop_event.wait()
+        finally:
+            self._running = False
 
     def stop(self) -> None:
-        """イベント処理ループを停止します。
+        """イベントバスを停止します。
 
-        内部の実行フラグをFalseに設定し、start()の処理ループが
-        次の反復で終了するようにします。
+        内部の実行フラグをFalseに設定し、start()の待機を終了させます。
 
-        これはフラグを設定するだけの同期操作で、処理ループが
-        実際に停止するまで待機しません。
+        これはフラグを設定するだけの同期操作で、ディスパッチ中の
+        イベント処理の完了は待機しません。
         """
         self._running = False
+        self._stop_event.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     async def _process_event(self, event: Event) -> None:
         """単一のイベントを購読者にルーティングして処理します。
 
         実際のイベントディスパッチを処理する内部メソッドです。イベントタイプの
-        すべての購読者を見つけて、それらを並行して呼び出します。
+        すべての購読者を見つけて、購読時に整列済みの順序で並行して呼び出します。
 
         同期と非同期の両方のコールバックがサポートされています。同期コールバックは
-        イベントループのブロックを避けるためにasyncio.to_thread()でラップされます。
+        イベントループのブロックを避けるためにバス専用のスレッドプールで実行されます。
 
-        個々のコールバックの例外はキャッチされ無視されるため、
+        個々のコールバックの例外はキャッチされてログに記録されるため、
         一つの失敗した購読者が他に影響することを防ぎます。
 
         Args:
             event: 処理するEvent。
         """
-        subscribers = self._subscribers.get(event.type, [])
+        subscribers = self._subscribers.get(event.type, ())
+        wildcard_subscribers = self._wildcard_subscribers
+        count = len(subscribers) + len(wildcard_subscribers)
+        if count == 0:
+            return
+
+        if count == 1:
+            # 購読者が1つだけの場合はgatherを使わず直接待機する
+            _, _, callback, is_coro = (subscribers or wildcard_subscribers)[0]
+            try:
+                if is_coro:
+                    await callback(event)
+                else:
+                    await self._run_sync(callback, event)
+            except Exception:
+                # Log subscriber errors without propagating, same as the gather path
+                logger.exception(
+                    "Error in event subscriber for '%s' (event %s)",
+                    event.type,
+                    event.id,
+                )
+            return
 
         tasks = []
-        for callback in subscribers:
-            if asyncio.iscoroutinefunction(callback):
+        for _, _, callback, is_coro in itertools.chain(
+            subscribers, wildcard_subscribers
+        ):
+            if is_coro:
                 tasks.append(callback(event))
             else:
                 # Run sync callbacks in thread pool to avoid blocking
-                tasks.append(asyncio.create_task(asyncio.to_thread(callback, event)))
+                tasks.append(self._run_sync(callback, event))
+
+        # Gather with return_exceptions=True to prevent one failure from canceling others
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(
+                    "Error in event subscriber for '%s' (event %s)",
+                    event.type,
+                    event.id,
+                    exc_info=result,
+                )
+
+    def _run_sync(
+        self, callback: Callable[[Event], Any], event: Event
+    ) -> "asyncio.Future[Any]":
+        """同期コールバックをバス専用のスレッドプールで実行します。
 
-        if tasks:
-            # Gather with return_exceptions=True to prevent one failure from canceling others
-            await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            callback: 実行する同期コールバック。
+            event: コールバックに渡すEvent。
+
+        Returns:
+            コールバックの完了を待機できるFuture。
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(thread_name_prefix="scarfy-sync")
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._executor, callback, event)
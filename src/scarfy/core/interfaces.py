@@ -11,8 +11,9 @@
 - Output: エージェントからの結果を処理（ログ、通知など）
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Sequence
 from .events import Event, EventBus
 
 
@@ -40,8 +41,14 @@ class Trigger(ABC):
         ...
         ...     async def stop(self):
         ...         self._running = False
+
+    属性：
+        default_event_type: 設定でevent_typeが指定されていない場合に
+                           パブリッシュするイベントタイプ
     """
 
+    default_event_type: ClassVar[str] = "default"
+
     @abstractmethod
     async def start(self, event_bus: EventBus, config: Dict[str, Any]) -> None:
         """トリガーを開始してイベントの監視を始めます。
@@ -118,8 +125,13 @@ class Agent(ABC):
         ...             'result': 'success',
         ...             'summary': 'ファイルが正常に処理されました'
         ...         }
+
+    属性：
+        default_concurrency: process_many()で同時に処理するイベント数のデフォルト値
     """
 
+    default_concurrency: int = 8
+
     @abstractmethod
     async def process(self, event: Event, config: Dict[str, Any]) -> Dict[str, Any]:
         """イベントを処理して結果を返します。
@@ -146,6 +158,34 @@ class Agent(ABC):
         """
         pass
 
+    async def process_many(
+        self,
+        events: Sequence[Event],
+        config: Dict[str, Any],
+        concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """複数のイベントを並行して処理します。
+
+        各イベントをprocess()で処理し、ファイル読み込みやサブプロセス実行などの
+        I/O待ちを重ね合わせます。同時実行数はセマフォで制限されます。
+
+        Args:
+            events: 処理するEventオブジェクトのシーケンス。
+            config: このエージェント固有の設定辞書（全イベントで共通）。
+            concurrency: 同時に処理する最大イベント数。
+                        Noneの場合はdefault_concurrencyが使用されます。
+
+        Returns:
+            eventsと同じ順序で並んだ処理結果のリスト。
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.default_concurrency)
+
+        async def _process_one(event: Event) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.process(event, config)
+
+        return list(await asyncio.gather(*(_process_one(e) for e in events)))
+
 
 class Output(ABC):
     """出力ハンドラーの基底インターフェース。
@@ -15,20 +15,15 @@ main()関数はコマンドライン引数を処理し、異なる実行モー
 """
 
 import asyncio
-import argparse
+import hashlib
+import os
+import threading
 from pathlib import Path
 from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional
 
 from .core.engine import ScarfyEngine, Workflow
 from .core.interfaces import ControllableTrigger
-from .triggers.file_watcher import FileWatcherTrigger
-from .triggers.manual import ManualTrigger
-from .agents.echo import EchoAgent
-from .agents.file_print import FilePrintAgent
-from .agents.claude_code import ClaudeCodeAgent
-from .outputs.console import ConsoleOutput
-from .outputs.file import FileOutput
-from .config.loader import ConfigLoader
 from .utils.logger import get_logger, init_logging
 
 # モジュールレベルでロガーを定義
@@ -44,24 +39,90 @@ def add_workflow_with_auto_trigger(engine: ScarfyEngine, workflow: Workflow) ->
     """
     trigger_type = workflow.trigger_config.get("type")
     if trigger_type == "file_watcher":
-        # ファイル監視の場合、パス別にユニークなトリガー名を生成
-        path = workflow.trigger_config.get("path", ".")
-        trigger_name = f"file_watcher_{abs(hash(path))}"
+        from .triggers.file_watcher import FileWatcherTrigger
+
+        # ファイル監視の場合、正規化したパス別にユニークなトリガー名を生成
+        # （"./foo" と "foo" のように同じディレクトリを指す設定で監視を重複させない）
+        path = os.path.realpath(workflow.trigger_config.get("path", "."))
+        path_hash = hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+        trigger_name = f"file_watcher_{path_hash}"
 
         # まだ登録されていない場合は新しいトリガーインスタンスを作成
         if trigger_name not in engine.triggers:
             logger.info("新しいトリガー作成: %s (path: %s)", trigger_name, path)
             engine.register_trigger(trigger_name, FileWatcherTrigger())
 
-        # ワークフローの設定を更新
+        # ワークフローの設定を更新（監視パスもトリガーと同じ正規化済みパスにする）
         workflow.trigger_config["type"] = trigger_name
+        workflow.trigger_config["path"] = path
+
+        # トリガーは最初のワークフローの設定で開始されるため、同じディレクトリを
+        # 異なるフィルター設定で監視しようとしている場合は警告する
+        for existing in engine.workflows:
+            if existing.trigger_config.get("type") != trigger_name:
+                continue
+            if existing.trigger_config != workflow.trigger_config:
+                logger.warning(
+                    "ワークフロー '%s' は '%s' と同じパスを監視するため、トリガー設定は"
+                    "'%s' のものが使用されます（無視される設定: %s）",
+                    workflow.name,
+                    existing.name,
+                    existing.name,
+                    {
+                        key: value
+                        for key, value in workflow.trigger_config.items()
+                        if existing.trigger_config.get(key) != value
+                    },
+                )
+            break
 
     engine.add_workflow(workflow)
 
 
+def _event_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """使用するイベントループの生成関数を返す。
+
+    uvloop がインストールされている場合はそのイベントループを使用し、
+    ない場合は None（標準の asyncio イベントループ）を返します。
+    """
+    try:
+        import uvloop  # type: ignore
+    except ImportError:
+        return None
+    return uvloop.new_event_loop  # type: ignore
+
+
+def _build_default_engine() -> ScarfyEngine:
+    """利用可能なすべてのコンポーネントを登録したエンジンを作成する。
+
+    file_watcher はワークフローごとに自動作成されるため、ここでは登録しない。
+    コンポーネントのモジュールは、エンジンを作らない実行経路（--helpなど）で
+    読み込まないようにここでimportする。
+
+    Returns:
+        コンポーネント登録済みのScarfyEngineインスタンス
+    """
+    from .triggers.manual import ManualTrigger
+    from .agents.echo import EchoAgent
+    from .agents.file_print import FilePrintAgent
+    from .agents.claude_code import ClaudeCodeAgent
+    from .outputs.console import ConsoleOutput
+    from .outputs.file import FileOutput
+
+    engine = ScarfyEngine()
+    engine.register_trigger("manual", ManualTrigger())
+    engine.register_agent("echo", EchoAgent())
+    engine.register_agent("file_print", FilePrintAgent())
+    engine.register_agent("claude_code", ClaudeCodeAgent())
+    engine.register_output("console", ConsoleOutput())
+    engine.register_output("file", FileOutput())
+    return engine
+
+
 def main_sync() -> None:
     """同期エントリーポイント。"""
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+        runner.run(main())
 
 
 async def main() -> None:
@@ -83,6 +144,9 @@ async def main() -> None:
         python -m scarfy --watch /path/to/monitor
         python -m scarfy --manual
     """
+    # argparse はCLI実行時にだけ必要なので、モジュールのimport時には読み込まない
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Scarfy - Agent Automation Framework",
         epilog="Use Ctrl+C to stop any running mode.",
@@ -96,18 +160,6 @@ async def main() -> None:
 
     args = parser.parse_args()
 
-    # エンジンを作成・設定
-    engine = ScarfyEngine()
-
-    # 利用可能なすべてのコンポーネントを登録
-    # file_watcher はワークフローごとに自動作成されるため、ここでは登録しない
-    engine.register_trigger("manual", ManualTrigger())
-    engine.register_agent("echo", EchoAgent())
-    engine.register_agent("file_print", FilePrintAgent())
-    engine.register_agent("claude_code", ClaudeCodeAgent())
-    engine.register_output("console", ConsoleOutput())
-    engine.register_output("file", FileOutput())
-
     # ロギング初期化
     init_logging()
 
@@ -115,7 +167,7 @@ async def main() -> None:
     if args.config:
         await run_with_config(args.config)
     elif args.manual:
-        await run_manual_mode(engine)
+        await run_manual_mode(_build_default_engine())
     else:
         logger.error("Please specify one of: --config <file> or --manual")
         logger.info("Use --help for more information.")
@@ -132,16 +184,19 @@ async def run_with_config(config_path: str) -> None:
     """
     try:
         # 設定ファイルを読み込み
+        from .config.loader import ConfigLoader
+
         loader = ConfigLoader()
         config_file_path = Path(config_path)
 
-        if not config_file_path.exists():
+        logger.info("設定ファイル読み込み中: %s", config_path)
+        try:
+            # YAMLのパースでイベントループを止めないようスレッドで読み込む
+            config = await loader.load_config_async(config_file_path)
+        except FileNotFoundError:
             logger.error("設定ファイルが見つかりません: %s", config_path)
             return
 
-        logger.info("設定ファイル読み込み中: %s", config_path)
-        config = loader.load_config(config_file_path)
-
         if "workflows" not in config:
             logger.error("設定ファイルに workflows が定義されていません")
             return
@@ -150,15 +205,7 @@ async def run_with_config(config_path: str) -> None:
         logger.info("ワークフローを読み込みました: %d個", len(workflows_config))
 
         # エンジンを作成・設定
-        engine = ScarfyEngine()
-
-        # 利用可能なすべてのコンポーネントを登録
-        engine.register_trigger("manual", ManualTrigger())
-        engine.register_agent("echo", EchoAgent())
-        engine.register_agent("file_print", FilePrintAgent())
-        engine.register_agent("claude_code", ClaudeCodeAgent())
-        engine.register_output("console", ConsoleOutput())
-        engine.register_output("file", FileOutput())
+        engine = _build_default_engine()
 
         # 設定からワークフローを作成
         for workflow_config in workflows_config:
@@ -168,21 +215,21 @@ async def run_with_config(config_path: str) -> None:
                 prompt_file = agent_config.get("prompt_file")
 
                 if prompt_file:
-                    # 相対パスの場合はプロジェクトルートを基準とする
-                    if not prompt_file.startswith("/"):
-                        prompt_path = Path(prompt_file)
-                    else:
-                        prompt_path = Path(prompt_file)
+                    # 相対パスはカレントディレクトリ（プロジェクトルート）を基準とする
+                    prompt_path = Path(prompt_file)
 
-                    if prompt_path.exists():
-                        prompt_content = loader.load_prompt_from_file(prompt_path)
-                        agent_config["prompt"] = prompt_content
-                        del agent_config["prompt_file"]  # prompt_file は削除
-                        logger.info("プロンプト読み込み: %s", str(prompt_path))
-                    else:
+                    try:
+                        prompt_content = await loader.load_prompt_from_file_async(
+                            prompt_path
+                        )
+                    except FileNotFoundError:
                         logger.warning(
                             "プロンプトファイルが見つかりません: %s", str(prompt_path)
                         )
+                    else:
+                        agent_config["prompt"] = prompt_content
+                        del agent_config["prompt_file"]  # prompt_file は削除
+                        logger.info("プロンプト読み込み: %s", str(prompt_path))
 
                 # パスの環境変数展開
                 trigger_config = workflow_config.get("trigger", {}).copy()
@@ -230,6 +277,105 @@ async def run_with_config(config_path: str) -> None:
         logger.error("エラーが発生しました: %s", str(e))
 
 
+async def _read_input(prompt: str) -> str:
+    """イベントループを止めずに標準入力から1行読み込む。
+
+    input() はデーモンスレッドで実行します。asyncio.to_thread だと終了時に
+    入力待ちのスレッドの完了をデフォルトエグゼキューターが待ってしまうため、
+    専用のデーモンスレッドを使用します。
+
+    Args:
+        prompt: 表示するプロンプト
+
+    Returns:
+        入力された行（末尾の改行なし）
+
+    Raises:
+        EOFError: 入力が終了した場合（Ctrl+D）
+    """
+    loop = asyncio.get_running_loop()
+    future: "asyncio.Future[str]" = loop.create_future()
+
+    def set_result(line: str) -> None:
+        if not future.done():
+            future.set_result(line)
+
+    def set_exception(exc: Exception) -> None:
+        if not future.done():
+            future.set_exception(exc)
+
+    def read() -> None:
+        try:
+            line = input(prompt)
+        except Exception as e:
+            loop.call_soon_threadsafe(set_exception, e)
+        else:
+            loop.call_soon_threadsafe(set_result, line)
+
+    threading.Thread(target=read, name="scarfy-input", daemon=True).start()
+    return await future
+
+
+async def _cmd_trigger(engine: ScarfyEngine) -> bool:
+    """手動トリガーイベントを送信する（trigger / t）。"""
+    manual_trigger: ControllableTrigger = engine.triggers["manual"]  # type: ignore
+    await manual_trigger.trigger(
+        {
+            "user_input": "manual_command",
+            "timestamp": datetime.now().isoformat(),
+        }
+    )
+    logger.info("Manual trigger sent")
+    return False
+
+
+async def _cmd_quit(engine: ScarfyEngine) -> bool:
+    """対話モードを終了する（quit / q）。"""
+    return True
+
+
+async def _cmd_help(engine: ScarfyEngine) -> bool:
+    """コマンド一覧を表示する（help / h）。"""
+    print("Commands:")
+    print("  'trigger' (or 't') - Send a manual trigger event")
+    print("  'claude <file> <prompt>' - Analyze file with Claude Code")
+    print("  'quit' (or 'q') - Exit manual mode")
+    print("  'help' (or 'h') - Show this help")
+    return False
+
+
+async def _cmd_claude(engine: ScarfyEngine, command: str) -> None:
+    """Claude Code実行コマンドを処理する: claude <file_path> <prompt>"""
+    parts = command.split(maxsplit=2)
+    if len(parts) < 3:
+        logger.error("Usage: claude <file_path> <prompt>")
+        print("   Example: claude test.py このコードをレビューしてください")
+        return
+
+    file_path = parts[1]
+    custom_prompt = parts[2]
+    manual_trigger: ControllableTrigger = engine.triggers["manual"]  # type: ignore
+    await manual_trigger.trigger(
+        {
+            "file_path": file_path,
+            "custom_prompt": custom_prompt,
+            "timestamp": datetime.now().isoformat(),
+        }
+    )
+    logger.info("Claude Code analysis started: %s", file_path)
+
+
+# 手動モードの引数なしコマンド -> ハンドラー（Trueを返すと対話モードを終了）
+_MANUAL_COMMANDS: Dict[str, Callable[[ScarfyEngine], Awaitable[bool]]] = {
+    "trigger": _cmd_trigger,
+    "t": _cmd_trigger,
+    "quit": _cmd_quit,
+    "q": _cmd_quit,
+    "help": _cmd_help,
+    "h": _cmd_help,
+}
+
+
 async def run_manual_mode(engine: ScarfyEngine) -> None:
     """対話的な手動トリガーモードを実行。
 
@@ -266,6 +412,8 @@ async def run_manual_mode(engine: ScarfyEngine) -> None:
 
     # エンジンをバックグラウンドで開始
     engine_task = asyncio.create_task(engine.start())
+    # 一度制御を譲り、最初のコマンドより前にトリガーの開始処理を進めておく
+    await asyncio.sleep(0)
 
     logger.info("Manual trigger mode - Interactive workflow testing")
     print("📝 Available commands:")
@@ -277,51 +425,27 @@ async def run_manual_mode(engine: ScarfyEngine) -> None:
     try:
         while True:
             try:
-                command = input("> ").strip().lower()
+                raw_command = (await _read_input("> ")).strip()
             except EOFError:
                 # Ctrl+D を処理
                 break
 
-            if command == "quit" or command == "q":
-                break
-            elif command == "trigger" or command == "t":
-                manual_trigger: ControllableTrigger = engine.triggers["manual"]  # type: ignore
-                await manual_trigger.trigger(
-                    {
-                        "user_input": "manual_command",
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                )
-                logger.info("Manual trigger sent")
-            elif command.startswith("claude "):
-                # Claude Code実行コマンド: claude <file_path> <prompt>
-                parts = command.split(" ", 2)
-                if len(parts) < 3:
-                    logger.error("Usage: claude <file_path> <prompt>")
-                    print("   Example: claude test.py このコードをレビューしてください")
-                else:
-                    file_path = parts[1]
-                    custom_prompt = parts[2]
-                    manual_trigger: ControllableTrigger = engine.triggers["manual"]  # type: ignore
-                    await manual_trigger.trigger(
-                        {
-                            "file_path": file_path,
-                            "custom_prompt": custom_prompt,
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                    )
-                    logger.info("Claude Code analysis started: %s", file_path)
-            elif command == "help" or command == "h":
-                print("Commands:")
-                print("  'trigger' (or 't') - Send a manual trigger event")
-                print("  'claude <file> <prompt>' - Analyze file with Claude Code")
-                print("  'quit' (or 'q') - Exit manual mode")
-                print("  'help' (or 'h') - Show this help")
-            elif command == "":
+            if not raw_command:
                 continue  # Ignore empty input
-            else:
+
+            # キーワードの判定だけ小文字化した文字列で行う
+            command = raw_command.lower()
+            if command.startswith("claude "):
+                # ファイルパスとプロンプトは入力どおりの大文字・小文字で渡す
+                await _cmd_claude(engine, raw_command)
+                continue
+
+            handler = _MANUAL_COMMANDS.get(command)
+            if handler is None:
                 logger.warning("Unknown command: %s", command)
                 print("Type 'help' for available commands.")
+            elif await handler(engine):
+                break
 
     except KeyboardInterrupt:
         pass
@@ -10,9 +10,34 @@
 出力はJSONを美しくフォーマットしたり、コンパクトな出力を印刷したりするよう設定できます。
 """
 
-import json
-from typing import Dict, Any
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, Any, Tuple
 from ..core.interfaces import Output
+from ..utils.json_encoder import dumps_json
+
+# データを出力行に整形する関数
+_Formatter = Callable[[Dict[str, Any]], str]
+
+# キャッシュする整形関数の最大数
+_MAX_CACHED_FORMATTERS = 128
+
+# 直近に整形したタイムスタンプ: (エポック秒, 整形済み文字列)
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+
+def _format_now() -> str:
+    """現在時刻を "%Y-%m-%d %H:%M:%S" 形式で返します。
+
+    秒単位の表示なので、同じ秒の間は前回整形した文字列を再利用します。
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    if second != _timestamp_cache[0]:
+        formatted = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+        _timestamp_cache = (second, formatted)
+    return _timestamp_cache[1]
 
 
 class ConsoleOutput(Output):
@@ -42,8 +67,16 @@ class ConsoleOutput(Output):
           "message": "File processed",
           "file_path": "/tmp/test.txt"
         }
+
+    設定値は設定辞書ごとに最初のsend()で解決してキャッシュされるため、
+    送信開始後に設定辞書を変更しないでください。
     """
 
+    def __init__(self) -> None:
+        """新しいConsoleOutputインスタンスを初期化します。"""
+        # id(config) -> (設定辞書, 整形関数)。id の再利用に備えて設定辞書も保持する
+        self._formatters: Dict[int, Tuple[Dict[str, Any], _Formatter]] = {}
+
     async def send(self, data: Dict[str, Any], config: Dict[str, Any]) -> None:
         """オプションのフォーマットでデータをコンソールに印刷。
 
@@ -69,26 +102,46 @@ class ConsoleOutput(Output):
               "file": "test.txt"
             }
         """
-        prefix = config.get("prefix", "[SCARFY]")
-
-        # データをJSONとしてフォーマット
-        if config.get("pretty", True):
-            output = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+        cached = self._formatters.get(id(config))
+        if cached is not None and cached[0] is config:
+            formatter = cached[1]
         else:
-            output = json.dumps(data, ensure_ascii=False, default=str)
+            formatter = self._build_formatter(config)
+            if len(self._formatters) >= _MAX_CACHED_FORMATTERS:
+                # 毎回新しい設定辞書で呼ばれる場合に無制限に増えないようにする
+                self._formatters.clear()
+            self._formatters[id(config)] = (config, formatter)
 
-        # オプションでタイムスタンプを追加
-        if config.get("timestamp", False):
-            from datetime import datetime
+        # コンソールに印刷（改行まで含めて1回の書き込みにする）
+        sys.stdout.write(formatter(data) + "\n")
 
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            prefix = f"{prefix} {timestamp}"
+    @staticmethod
+    def _build_formatter(config: Dict[str, Any]) -> _Formatter:
+        """設定値を解決済みの整形関数を作成します。
 
-        # コンソールに印刷
-        if config.get("pretty", True) and "\n" in output:
-            # 複数行出力: プレフィックスを別行で印刷
-            print(f"{prefix}")
-            print(output)
-        else:
+        Args:
+            config: 出力フォーマットの設定辞書
+
+        Returns:
+            データを受け取り、印刷する文字列を返す関数
+        """
+        prefix = config.get("prefix", "[SCARFY]")
+        pretty = config.get("pretty", True)
+        timestamp = config.get("timestamp", False)
+
+        def format_output(data: Dict[str, Any]) -> str:
+            # データをJSONとしてフォーマット
+            output = dumps_json(data, pretty=pretty)
+
+            # オプションでタイムスタンプを追加
+            line_prefix = prefix
+            if timestamp:
+                line_prefix = f"{prefix} {_format_now()}"
+
+            if pretty and "\n" in output:
+                # 複数行出力: プレフィックスを別行に置く
+                return f"{line_prefix}\n{output}"
             # 単一行出力: プレフィックスとデータを一緒に印刷
-            print(f"{prefix} {output}")
+            return f"{line_prefix} {output}"
+
+        return format_output
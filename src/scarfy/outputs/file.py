@@ -11,12 +11,62 @@
 ディレクトリ構造を自動作成します。
 """
 
-import json
-import aiofiles
+import asyncio
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any
+from typing import Deque, Dict, Any, List, Tuple
 from datetime import datetime
 from ..core.interfaces import Output
+from ..utils.json_encoder import dumps_json
+
+# 1回のファイル書き込みにまとめる最大エントリ数
+_MAX_BATCH = 64
+
+# 書き込み待ちエントリ: (ファイルモード, 書き込むテキスト, 完了を通知するFuture)
+_PendingWrite = Tuple[str, str, "asyncio.Future[None]"]
+
+# 解決済み設定を保持する設定辞書の最大数
+_MAX_CACHED_SETTINGS = 128
+
+
+@dataclass(frozen=True, slots=True)
+class _FileSettings:
+    """設定辞書から解決したFileOutputの設定値。"""
+
+    path: Path
+    mode: str
+    jsonl: bool
+    pretty: bool
+    include_timestamp: bool
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "_FileSettings":
+        """設定辞書からデフォルト値を補って設定値を作成します。"""
+        output_format = config.get("format", "json").lower()
+        return cls(
+            path=Path(config.get("path", "output.json")),
+            mode="a" if config.get("append", True) else "w",
+            jsonl=output_format == "jsonl",
+            # JSONLは1行1オブジェクトのため、整形出力はJSON形式でのみ有効
+            pretty=bool(config.get("pretty", False)) and output_format == "json",
+            include_timestamp=bool(config.get("include_timestamp", True)),
+        )
+
+
+def _write_text(path: Path, mode: str, text: str) -> None:
+    """ファイルにテキストを書き込みます（スレッドで実行）。
+
+    親ディレクトリは存在しない場合にだけ作成するため、通常の書き込みでは
+    mkdir のシステムコールが発生しません。
+    """
+    try:
+        with open(path, mode, encoding="utf-8") as f:
+            f.write(text)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, mode, encoding="utf-8") as f:
+            f.write(text)
 
 
 class FileOutput(Output):
@@ -35,7 +85,8 @@ class FileOutput(Output):
         append (bool): 既存ファイルに追記するか（デフォルト: True）
         format (str): 出力フォーマット - "json"または"jsonl"（デフォルト: "json"）
         include_timestamp (bool): 出力にタイムスタンプを含めるか（デフォルト: True）
-        pretty (bool): JSON出力を美しくフォーマットするか（デフォルト: False）
+        pretty (bool): JSON出力を美しくフォーマットするか（デフォルト: False、
+                       "jsonl"では無視されます）
 
     設定例:
         {
@@ -55,8 +106,25 @@ class FileOutput(Output):
 
         include_timestamp=Falseの場合:
         { ... 元のエージェント出力 ... }
+
+    同じファイルへの書き込みはパスごとのキューに積まれ、1つの書き込みタスクが
+    溜まっているエントリをまとめて1回のopen/writeで書き込みます。send()は
+    自分のエントリが書き込まれるまで待機するため、戻った時点でデータは
+    ファイルに書き込まれています。
+
+    設定値は設定辞書ごとに最初のsend()で解決されるため、送信開始後に
+    設定辞書の内容を変更しても反映されません。
     """
 
+    def __init__(self) -> None:
+        """新しいFileOutputインスタンスを初期化します。"""
+        # 出力先パスごとの書き込み待ちエントリと、それを処理中の書き込みタスク
+        self._queues: Dict[Path, Deque[_PendingWrite]] = {}
+        self._writers: Dict[Path, "asyncio.Task[None]"] = {}
+        # id(config) -> (設定辞書, 解決済み設定)。設定辞書の同一性も確認する
+        # （最大_MAX_CACHED_SETTINGS件まで保持し、超えた場合は破棄する）
+        self._settings: Dict[int, Tuple[Dict[str, Any], _FileSettings]] = {}
+
     async def send(self, data: Dict[str, Any], config: Dict[str, Any]) -> None:
         """設定されたファイルにデータを書き込み。
 
@@ -86,41 +154,105 @@ class FileOutput(Output):
             ... }
             >>> await output.send(data, config)
         """
-        output_path = Path(config.get("path", "output.json"))
+        settings = self._resolve_settings(config)
+        output_path = settings.path
+        mode = settings.mode
 
-        # ディレクトリの存在を確認
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # 出力データを準備
-        if config.get("include_timestamp", True):
-            output_data = {"timestamp": datetime.now().isoformat(), "data": data}
+        # 設定に基づいて出力をフォーマット
+        if settings.include_timestamp:
+            payload: Any = {"timestamp": datetime.now().isoformat(), "data": data}
         else:
-            output_data = data
+            payload = data
+        output_text = dumps_json(payload, pretty=settings.pretty)
 
-        # ファイルモードを決定
-        mode = "a" if config.get("append", True) else "w"
+        if settings.jsonl:
+            # JSONLフォーマット: 1行に1つのJSONオブジェクト
+            output_text += "\n"
+        elif mode == "a":
+            # JSONフォーマット: エントリを改行で区切る
+            output_text = "\n" + output_text
 
-        # 設定に基づいて出力をフォーマット
-        output_format = config.get("format", "json").lower()
-        pretty = config.get("pretty", False)
-
-        if pretty and output_format == "json":
-            output_text = json.dumps(
-                output_data, indent=2, ensure_ascii=False, default=str
+        # 書き込みキューに積み、書き込みタスクが処理するまで待機
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        queue = self._queues.setdefault(output_path, deque())
+        queue.append((mode, output_text, future))
+        if output_path not in self._writers:
+            self._writers[output_path] = asyncio.create_task(
+                self._write_pending(output_path, queue)
             )
-        else:
-            output_text = json.dumps(output_data, ensure_ascii=False, default=str)
-
-        # ファイルに書き込み
-        async with aiofiles.open(str(output_path), mode=mode, encoding="utf-8") as f:  # type: ignore
-            if mode == "a" and output_format == "jsonl":
-                # JSONLフォーマット: 1行に1つのJSONオブジェクト
-                await f.write(output_text + "\n")
-            elif mode == "a":
-                # JSONフォーマット: エントリを改行で区切る
-                await f.write("\n" + output_text)
-            else:
-                # 上書きモード: データをそのまま書き込み
-                await f.write(output_text)
-                if output_format == "jsonl":
-                    await f.write("\n")
+        await future
+
+    def _resolve_settings(self, config: Dict[str, Any]) -> _FileSettings:
+        """設定辞書の設定値を解決します（設定辞書ごとにキャッシュ）。
+
+        Args:
+            config: ファイル出力の設定辞書
+
+        Returns:
+            解決済みの設定値
+        """
+        cached = self._settings.get(id(config))
+        if cached is not None and cached[0] is config:
+            return cached[1]
+
+        settings = _FileSettings.from_config(config)
+        if len(self._settings) >= _MAX_CACHED_SETTINGS:
+            self._settings.clear()
+        self._settings[id(config)] = (config, settings)
+        return settings
+
+    async def _write_pending(self, path: Path, queue: Deque[_PendingWrite]) -> None:
+        """キューが空になるまで、溜まったエントリをまとめてファイルに書き込みます。
+
+        バッチ内に上書きモードのエントリがある場合は、最後の上書きエントリ以降を
+        上書きモードで書き込みます（順に書き込んだ場合と同じ結果になります）。
+
+        Args:
+            path: 書き込み先ファイルパス
+            queue: pathへの書き込み待ちエントリ
+        """
+        batch: List[_PendingWrite] = []
+        try:
+            while queue:
+                batch = [queue.popleft() for _ in range(min(len(queue), _MAX_BATCH))]
+                start = 0
+                mode = "a"
+                for i, (entry_mode, _, _) in enumerate(batch):
+                    if entry_mode == "w":
+                        start, mode = i, "w"
+
+                try:
+                    await asyncio.to_thread(
+                        _write_text,
+                        path,
+                        mode,
+                        "".join(text for _, text, _ in batch[start:]),
+                    )
+                except (OSError, TypeError, ValueError) as e:
+                    # 書き込みエラー（エンコードエラーを含む）は待機中のsend()に伝える
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for _, _, future in batch:
+                        if not future.done():
+                            future.set_result(None)
+                batch = []
+        except asyncio.CancelledError:
+            # 書き込みタスク自体がキャンセルされた場合だけ待機中のsend()もキャンセルする
+            for _, _, future in [*batch, *queue]:
+                future.cancel()
+            queue.clear()
+            raise
+        except Exception as e:
+            # 想定外の例外もキャンセルではなく書き込みエラーとしてsend()に伝える
+            for _, _, future in [*batch, *queue]:
+                if not future.done():
+                    future.set_exception(e)
+            queue.clear()
+            raise
+        finally:
+            del self._writers[path]
+            # パスごとの状態を残さないよう、書き込みタスクと一緒にキューも削除する
+            if self._queues.get(path) is queue:
+                del self._queues[path]
@@ -9,13 +9,22 @@ FileWatcherTriggerはファイルが変更された際にイベントをパブ
 """
 
 import asyncio
-import concurrent.futures
 import fnmatch
+import os
+import re
+import sys
 from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.observers.api import BaseObserver
-from watchdog.events import FileSystemEventHandler
-from typing import Dict, Any, Optional
+from watchdog.events import (
+    EVENT_TYPE_CREATED,
+    EVENT_TYPE_MODIFIED,
+    DirCreatedEvent,
+    FileCreatedEvent,
+    FileModifiedEvent,
+    FileSystemEventHandler,
+)
+from typing import Dict, Any, List, Optional, Tuple, Type
 from watchdog.events import FileSystemEvent
 import time
 
@@ -27,6 +36,66 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+# ワイルドカードを含まない文字列（fnmatch の特殊文字 * ? [ 以外）
+_LITERAL_RE = re.compile(r"[^*?\[]+")
+
+
+class _GlobMatcher:
+    """ファイル名を複数のglobパターンと照合する。
+
+    単純なパターンは文字列操作で判定し、それ以外だけを1つにまとめた
+    正規表現で照合します。fnmatch.fnmatch と同じく、os.path.normcase で
+    正規化したファイル名に対して使用します。
+    """
+
+    __slots__ = ("literals", "suffixes", "prefixes", "regex")
+
+    def __init__(self, patterns: List[str]) -> None:
+        """パターンを種類ごとに分類してコンパイルする。
+
+        Args:
+            patterns: globパターンのリスト
+        """
+        literals = set()
+        suffixes = []
+        prefixes = []
+        others = []
+        for pattern in map(os.path.normcase, patterns):
+            if not pattern or _LITERAL_RE.fullmatch(pattern):
+                literals.add(pattern)  # 例: ".DS_Store"
+            elif pattern[0] == "*" and _LITERAL_RE.fullmatch(pattern[1:]):
+                suffixes.append(pattern[1:])  # 例: "*.tmp"
+            elif pattern[-1] == "*" and _LITERAL_RE.fullmatch(pattern[:-1]):
+                prefixes.append(pattern[:-1])  # 例: "~*"
+            else:
+                others.append(pattern)
+
+        self.literals = frozenset(literals)
+        self.suffixes = tuple(suffixes)
+        self.prefixes = tuple(prefixes)
+        self.regex = (
+            re.compile("|".join(fnmatch.translate(p) for p in others))
+            if others
+            else None
+        )
+
+    def matches(self, filename: str) -> bool:
+        """ファイル名がいずれかのパターンにマッチするか判定する。
+
+        Args:
+            filename: os.path.normcase で正規化済みのファイル名
+
+        Returns:
+            いずれかのパターンにマッチした場合True
+        """
+        return (
+            filename in self.literals
+            or filename.endswith(self.suffixes)
+            or filename.startswith(self.prefixes)
+            or (self.regex is not None and self.regex.match(filename) is not None)
+        )
+
+
 class FileChangeHandler(FileSystemEventHandler):
     """ファイルシステム変更用のカスタムイベントハンドラー。
 
@@ -40,7 +109,6 @@ class FileChangeHandler(FileSystemEventHandler):
         event_bus: イベントをパブリッシュするEventBusインスタンス
         config: ワークフローからの設定辞書
         loop: タスクをスケジュールするasyncioイベントループ
-        pending_timers: デバウンス用の保留中タイマー辞書
         debounce_delay: デバウンス遅延時間（秒）
     """
 
@@ -62,23 +130,48 @@ class FileChangeHandler(FileSystemEventHandler):
         self.config = config
         self.loop = loop
         self.filename_patterns = config.get("filename_patterns", [])
+        # 発行するイベントタイプ（イベントごとに設定を引かないよう保持）
+        self._event_type: str = config.get(
+            "event_type", FileWatcherTrigger.default_event_type
+        )
 
-        # デバウンス機能
-        self.pending_timers: Dict[str, concurrent.futures.Future] = (
-            {}
-        )  # file_path -> timer_task
-        self.last_event_times: Dict[str, float] = (
-            {}
-        )  # file_path -> last_event_timestamp
-        self.timer_ids: Dict[str, int] = {}  # file_path -> timer_id (ユニークID用)
-        self._next_timer_id: int = 0  # タイマーIDのカウンター
+        # デバウンス機能（イベントループ上でのみ操作する）
+        # file_path -> (発行期限, action)。期限の早い順に並ぶ
+        self._deadlines: Dict[str, Tuple[float, str]] = {}
+        # 期限を過ぎたイベントを発行するタスク（保留中のエントリがある間だけ実行）
+        self._debounce_task: Optional["asyncio.Task[None]"] = None
+        self._closed = False
         self.debounce_delay = config.get("debounce_delay", 1.0)  # デフォルト1秒
+        if self.debounce_delay <= 0:
+            # 遅延なしの場合はデバウンス処理を経由せずに直接発行する
+            self._schedule_debounced_event = self._schedule_immediate  # type: ignore
 
         # 監視対象イベントタイプの設定
         watch_events = config.get("watch_events", ["created", "modified"])
         self.watch_created = "created" in watch_events
         self.watch_modified = "modified" in watch_events
 
+        # watchdogのイベントタイプ -> (action, ログメッセージ)。監視対象のみ登録
+        self._actions: Dict[str, Tuple[str, str]] = {}
+        if self.watch_created:
+            self._actions[EVENT_TYPE_CREATED] = ("file_created", "ファイル作成検出: %s")
+        if self.watch_modified:
+            self._actions[EVENT_TYPE_MODIFIED] = (
+                "file_modified",
+                "ファイル変更検出: %s",
+            )
+
+        # Observerに渡すイベントフィルター。監視対象外のイベントは
+        # inotifyのマスクで除外され、ハンドラーまで届かない
+        self.event_filter: List[Type[FileSystemEvent]] = []
+        if self.watch_created:
+            self.event_filter.append(FileCreatedEvent)
+        if self.watch_modified:
+            self.event_filter.append(FileModifiedEvent)
+        if config.get("recursive", False) and not self.watch_created:
+            # 新しいサブディレクトリを監視対象に加えるには作成イベントが必要
+            self.event_filter.append(DirCreatedEvent)
+
         # 一時ファイル除外パターン
         default_temp_patterns = [
             "*.tmp",
@@ -96,35 +189,37 @@ class FileChangeHandler(FileSystemEventHandler):
         ]
         self.temp_patterns = config.get("ignore_temp_files", default_temp_patterns)
 
-    def _matches_filename_patterns(self, file_path: str) -> bool:
-        """ファイルパスが設定されたパターンにマッチするかチェック。
+        # パターンはイベントごとに照合するため、一度だけ分類・コンパイルしておく
+        self._temp_matcher = _GlobMatcher(self.temp_patterns)
+        self._filename_matcher = (
+            _GlobMatcher(self.filename_patterns) if self.filename_patterns else None
+        )
+
+    def _matches_filename_patterns(self, filename: str) -> bool:
+        """ファイル名が設定されたパターンにマッチするかチェック。
 
         Args:
-            file_path: チェックするファイルパス
+            filename: チェックするファイル名（os.path.normcase で正規化済み）
 
         Returns:
             パターンが未設定の場合、またはいずれかのパターンにマッチした場合True
         """
         # パターンが設定されていない場合は全てのファイルを対象
-        if not self.filename_patterns:
+        if self._filename_matcher is None:
             return True
 
-        filename = Path(file_path).name
-        return any(
-            fnmatch.fnmatch(filename, pattern) for pattern in self.filename_patterns
-        )
+        return self._filename_matcher.matches(filename)
 
-    def _is_temp_file(self, file_path: str) -> bool:
+    def _is_temp_file(self, filename: str) -> bool:
         """ファイルが一時ファイルかどうかをチェック。
 
         Args:
-            file_path: チェックするファイルパス
+            filename: チェックするファイル名（os.path.normcase で正規化済み）
 
         Returns:
             一時ファイルの場合True
         """
-        filename = Path(file_path).name
-        return any(fnmatch.fnmatch(filename, pattern) for pattern in self.temp_patterns)
+        return self._temp_matcher.matches(filename)
 
     def _should_process_file(self, file_path: str) -> bool:
         """ファイルを処理対象とするかどうかを総合判定。
@@ -135,161 +230,133 @@ class FileChangeHandler(FileSystemEventHandler):
         Returns:
             処理対象の場合True
         """
+        filename = os.path.normcase(os.path.basename(file_path))
+
         # 一時ファイルは除外
-        if self._is_temp_file(file_path):
+        if self._is_temp_file(filename):
             return False
 
         # ファイル名パターンチェック
-        return self._matches_filename_patterns(file_path)
+        return self._matches_filename_patterns(filename)
 
     def _schedule_debounced_event(self, action: str, file_path: str) -> None:
-        """タイムスタンプベースのデバウンス機能付きでイベントをスケジュール。
+        """デバウンス付きでイベントをスケジュール（watchdogのスレッドから呼ばれる）。
 
-        各タイマーにユニークIDを付与し、実行時に最新性をチェックして
-        確実に重複を防止します。
+        発行期限の更新はイベントループ上で行うため、ここではループに
+        処理を渡すだけです。
 
         Args:
             action: ファイルシステムアクションの種類
             file_path: 影響を受けたファイルのフルパス
         """
-        current_time = time.time()
+        deadline = time.monotonic() + self.debounce_delay
+        self.loop.call_soon_threadsafe(self._enqueue, action, file_path, deadline)
 
-        # 最新のイベント時刻を記録
-        self.last_event_times[file_path] = current_time
+    def _schedule_immediate(self, action: str, file_path: str) -> None:
+        """デバウンスせずにイベントを発行する（watchdogのスレッドから呼ばれる）。
 
-        # ユニークなタイマーIDを生成
-        timer_id = self._next_timer_id
-        self._next_timer_id += 1
-        self.timer_ids[file_path] = timer_id
+        debounce_delayが0以下の場合に_schedule_debounced_eventの代わりに
+        使用されます。
 
-        logger.debug(
-            "⏰ [FileWatcherTrigger] デバウンスタイマー作成: %s (ID: %s, action: %s)",
-            file_path,
-            timer_id,
-            action,
-        )
-
-        # 既存のタイマーをキャンセル（ベストエフォート）
-        if file_path in self.pending_timers:
-            old_timer = self.pending_timers[file_path]
-            old_timer.cancel()
-
-        # 新しいタイマーを作成してスケジュール
-        timer_task = asyncio.run_coroutine_threadsafe(
-            self._delayed_publish_with_timestamp_check(
-                action, file_path, timer_id, current_time
-            ),
-            self.loop,
+        Args:
+            action: ファイルシステムアクションの種類
+            file_path: 影響を受けたファイルのフルパス
+        """
+        asyncio.run_coroutine_threadsafe(
+            self._publish_immediately(action, file_path), self.loop
         )
-        self.pending_timers[file_path] = timer_task
-
-    async def _delayed_publish_with_timestamp_check(
-        self, action: str, file_path: str, timer_id: int, scheduled_time: float
-    ) -> None:
-        """タイムスタンプベースのチェック付きデバウンス実行。
 
-        タイマー実行時に二重チェック（ID + 時刻）を行い、
-        確実に最新タイマーのみがイベントを発行します。
+    async def _publish_immediately(self, action: str, file_path: str) -> None:
+        """クローズ済みでなければイベントを発行する（イベントループ上で実行）。
 
         Args:
             action: ファイルシステムアクションの種類
             file_path: 影響を受けたファイルのフルパス
-            timer_id: このタイマーのユニークID
-            scheduled_time: このタイマーがスケジュールされた時刻
         """
+        if self._closed:
+            return
+
         try:
-            # デバウンス待機
-            await asyncio.sleep(self.debounce_delay)
+            await self._publish_event(action, file_path)
+        except Exception:
+            logger.exception("イベント発行エラー: %s", file_path)
 
-            # 条件チェック1: 自分が最新のタイマーか？
-            current_timer_id = self.timer_ids.get(file_path)
-            if current_timer_id != timer_id:
-                logger.debug(
-                    "⏰ [FileWatcherTrigger] 古いタイマーのため実行スキップ: %s (ID: %s, 現在: %s)",
-                    file_path,
-                    timer_id,
-                    current_timer_id,
-                )
-                return
+    def _enqueue(self, action: str, file_path: str, deadline: float) -> None:
+        """ファイルの発行期限を更新する（イベントループ上で実行）。
 
-            # 条件チェック2: 十分な時間が経過したか？
-            if file_path not in self.last_event_times:
-                logger.debug(
-                    "⏰ [FileWatcherTrigger] イベント時刻が削除されているため実行スキップ: %s (ID: %s)",
-                    file_path,
-                    timer_id,
-                )
-                return
+        同じファイルの既存エントリは削除してから末尾に追加し直すため、
+        遅延時間が一定の間は_deadlinesが期限順に並んだ状態に保たれます。
 
-            time_since_last_event = time.time() - self.last_event_times[file_path]
-            if time_since_last_event < self.debounce_delay:
-                logger.debug(
-                    "⏰ [FileWatcherTrigger] まだ新しいイベントがあるため実行スキップ: %s (ID: %s, 経過時間: %.2fs)",
-                    file_path,
-                    timer_id,
-                    time_since_last_event,
-                )
-                return
-
-            # 全ての条件を満たした場合のみイベント発行
-            logger.debug(
-                "🚀 [FileWatcherTrigger] デバウンス条件クリア、イベント発行: %s (ID: %s)",
-                file_path,
-                timer_id,
-            )
-            await self._publish_event(action, file_path)
+        Args:
+            action: ファイルシステムアクションの種類（最後のイベントのものを使用）
+            file_path: 影響を受けたファイルのフルパス
+            deadline: イベントを発行する時刻（time.monotonic基準）
+        """
+        if self._closed:
+            return
 
-        except asyncio.CancelledError:
-            logger.debug(
-                "⏰ [FileWatcherTrigger] デバウンス: %s のタイマー(ID: %s)がキャンセルされました",
-                file_path,
-                timer_id,
-            )
-            raise
-        finally:
-            # クリーンアップ（自分が最新の場合のみ）
-            if self.timer_ids.get(file_path) == timer_id:
-                if file_path in self.pending_timers:
-                    del self.pending_timers[file_path]
-                if file_path in self.last_event_times:
-                    del self.last_event_times[file_path]
-                if file_path in self.timer_ids:
-                    del self.timer_ids[file_path]
-                logger.debug(
-                    "🧹 [FileWatcherTrigger] デバウンスデータクリーンアップ: %s (ID: %s)",
-                    file_path,
-                    timer_id,
-                )
+        self._deadlines.pop(file_path, None)
+        self._deadlines[file_path] = (deadline, action)
+        logger.debug(
+            "⏰ [FileWatcherTrigger] デバウンス期限更新: %s (action: %s)",
+            file_path,
+            action,
+        )
 
-    def on_created(self, event: FileSystemEvent) -> None:
-        """ファイル作成イベントを処理。
+        if self._debounce_task is None:
+            self._debounce_task = self.loop.create_task(self._debounce_loop())
 
-        監視ディレクトリに新しいファイルが作成された際にwatchdogから呼ばれます。
-        ディレクトリではなく、通常のファイルのみを処理し、デバウンス機能を適用します。
+    async def _debounce_loop(self) -> None:
+        """期限を過ぎたファイルのイベントを発行する。
 
-        Args:
-            event: ファイルパスとメタデータを含むwatchdogからのFileSystemEvent
+        先頭（最も期限の早い）エントリの期限まで待機し、その間に期限が
+        延長されていなければイベントを発行します。保留中のエントリが
+        なくなると終了し、次のイベントで再び開始されます。
         """
-        if not event.is_directory and self.watch_created:
-            src_path = str(event.src_path)  # bytes to str conversion
-            if self._should_process_file(src_path):
-                logger.info("ファイル作成検出: %s", src_path)
-                self._schedule_debounced_event("file_created", src_path)
+        try:
+            while self._deadlines:
+                file_path, (deadline, action) = next(iter(self._deadlines.items()))
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    # 待機中に期限が延長される可能性があるため、起床後に再確認する
+                    await asyncio.sleep(delay)
+                    continue
+
+                del self._deadlines[file_path]
+                logger.debug(
+                    "🚀 [FileWatcherTrigger] デバウンス条件クリア、イベント発行: %s",
+                    file_path,
+                )
+                try:
+                    await self._publish_event(action, file_path)
+                except Exception:
+                    logger.exception("イベント発行エラー: %s", file_path)
+        finally:
+            self._debounce_task = None
 
-    def on_modified(self, event: FileSystemEvent) -> None:
-        """ファイル変更イベントを処理。
+    def dispatch(self, event: FileSystemEvent) -> None:
+        """watchdogのイベントを処理。
 
-        監視ディレクトリ内の既存ファイルが変更された際にwatchdogから呼ばれます。
-        ディレクトリではなく、通常のファイルのみを処理し、デバウンス機能を適用します。
+        基底クラスのようにイベントタイプごとのメソッド（on_created、
+        on_modifiedなど）へ振り分けず、監視対象のイベントタイプを
+        テーブルで引いて直接処理します。ディレクトリではなく、通常のファイルのみを
+        処理し、デバウンス機能を適用します。
 
         Args:
             event: ファイルパスとメタデータを含むwatchdogからのFileSystemEvent
         """
-        if not event.is_directory and self.watch_modified:
-            src_path = str(event.src_path)  # bytes to str conversion
-            if self._should_process_file(src_path):
-                logger.info("ファイル変更検出: %s", src_path)
-                self._schedule_debounced_event("file_modified", src_path)
+        mapping = self._actions.get(event.event_type)
+        if mapping is None or event.is_directory:
+            return
+
+        src_path = str(event.src_path)  # bytes to str conversion
+        if self._should_process_file(src_path):
+            # 同じパスのイベントが繰り返し届くため、internして
+            # _deadlinesのキー比較を同一性チェックで済ませる
+            src_path = sys.intern(src_path)
+            action, message = mapping
+            logger.info(message, src_path)
+            self._schedule_debounced_event(action, src_path)
 
     async def _publish_event(self, action: str, file_path: str) -> None:
         """ファイルシステムイベントをScarfy Eventに変換してパブリッシュ。
@@ -301,15 +368,18 @@ class FileChangeHandler(FileSystemEventHandler):
             action: ファイルシステムアクションの種類（"file_created", "file_modified"など）
             file_path: 影響を受けたファイルのフルパス
         """
+        # Pathオブジェクトを作らず、文字列のままファイル名と親ディレクトリに分解する
+        parent_directory, file_name = os.path.split(file_path)
+        file_extension = os.path.splitext(file_name)[1]
         event = Event(
             id="",  # Auto-generated
-            type=self.config.get("event_type", "file_change"),
+            type=self._event_type,
             data={
                 "action": action,
                 "file_path": file_path,
-                "file_name": Path(file_path).name,
-                "file_extension": Path(file_path).suffix,
-                "parent_directory": str(Path(file_path).parent),
+                "file_name": file_name,
+                "file_extension": file_extension,
+                "parent_directory": parent_directory or ".",
             },
             timestamp=None,  # Auto-generated
             source="file_watcher",
@@ -320,17 +390,18 @@ class FileChangeHandler(FileSystemEventHandler):
     async def cleanup(self) -> None:
         """ハンドラーのクリーンアップ。
 
-        保留中のタイマーをすべてキャンセルし、デバウンス関連の
-        全ての追跡データをクリアします。
+        デバウンスタスクをキャンセルし、保留中のイベントを破棄します。
+        以降に届いたファイルイベントは無視されます。
         """
-        # 保留中のタイマーをキャンセル
-        for timer_task in list(self.pending_timers.values()):
-            timer_task.cancel()
+        self._closed = True
+        self._deadlines.clear()
 
-        # 全ての追跡データをクリア
-        self.pending_timers.clear()
-        self.last_event_times.clear()
-        self.timer_ids.clear()
+        # デバウンスタスクをキャンセル
+        task = self._debounce_task
+        self._debounce_task = None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
 
         logger.info(
             "🧹 [FileWatcherTrigger] デバウンスタイマーと追跡データをクリーンアップしました"
@@ -375,6 +446,8 @@ class FileWatcherTrigger(Trigger):
         handler: イベント処理用のFileChangeHandlerインスタンス
     """
 
+    default_event_type = "file_change"
+
     def __init__(self) -> None:
         """ファイルウォッチャートリガーを初期化。
 
@@ -419,7 +492,10 @@ class FileWatcherTrigger(Trigger):
             self.handler = FileChangeHandler(event_bus, config, current_loop)
             self.observer = Observer()
             self.observer.schedule(
-                self.handler, watch_path, recursive=config.get("recursive", False)
+                self.handler,
+                watch_path,
+                recursive=config.get("recursive", False),
+                event_filter=self.handler.event_filter,
             )
             self.observer.start()
             logger.info("監視開始成功: %s", watch_path)
@@ -44,6 +44,8 @@ class ManualTrigger(ControllableTrigger):
         _running: トリガーが現在アクティブかどうか
     """
 
+    default_event_type = "manual"
+
     def __init__(self) -> None:
         """手動トリガーを初期化。
 
@@ -117,7 +119,7 @@ class ManualTrigger(ControllableTrigger):
 
         event = Event(
             id="",  # 自動生成
-            type=self.config.get("event_type", "manual"),
+            type=self.config.get("event_type", self.default_event_type),
             data=data or {},
             timestamp=None,  # 自動生成
             source="manual",
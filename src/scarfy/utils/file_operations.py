@@ -4,8 +4,9 @@
 ファイル関連操作を担当します。
 """
 
+import os
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, Optional, Union
 
 
 class FileOperations:
@@ -16,7 +17,10 @@ class FileOperations:
     """
 
     def validate_file(
-        self, file_path: Path, config: Dict[str, Any]
+        self,
+        file_path: Path,
+        config: Dict[str, Any],
+        file_stat: Optional[os.stat_result] = None,
     ) -> Union[bool, str]:
         """ファイルのセキュリティ検証。
 
@@ -25,6 +29,7 @@ class FileOperations:
         Args:
             file_path: 検証するファイルのPath
             config: 検証設定（max_file_size, allowed_extensions）
+            file_stat: 取得済みのstat結果（オプション、指定時は再取得しない）
 
         Returns:
             True（検証成功）またはエラーメッセージ文字列
@@ -32,7 +37,9 @@ class FileOperations:
         # ファイルサイズチェック
         max_size = config.get("max_file_size", 1048576)  # 1MB
         try:
-            file_size = file_path.stat().st_size
+            if file_stat is None:
+                file_stat = file_path.stat()
+            file_size = file_stat.st_size
             if file_size > max_size:
                 return f"ファイルサイズが制限を超えています: {file_size} > {max_size} バイト"
         except OSError as e:
@@ -51,8 +58,9 @@ class FileOperations:
     def read_file_safe(self, file_path: Path) -> str:
         """ファイル内容を安全に読み込み。
 
-        UTF-8エンコーディングで読み込みを試行し、
-        失敗した場合はエラー処理付きで再試行します。
+        UTF-8として読み込み、デコードできないバイトは置換文字に置き換えます。
+        ファイルはバイナリで一度だけ読み込み、改行はテキストモードと同じく
+        "\\n" に統一します。
 
         Args:
             file_path: 読み込むファイルのPath
@@ -61,15 +69,12 @@ class FileOperations:
             ファイル内容の文字列、またはエラーメッセージ
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # エンコーディングエラーの場合、エラー文字を置換して読み込み
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                    return f.read()
-            except Exception as e:
-                return f"[ファイル読み込みエラー（エンコーディング問題）: {file_path}, {e}]"
+            with open(file_path, "rb") as f:
+                data = f.read()
+            content = data.decode("utf-8", errors="replace")
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            return content
         except FileNotFoundError:
             return f"[ファイルが見つかりません: {file_path}]"
         except PermissionError:
@@ -103,25 +108,26 @@ class FileOperations:
                 "output_basename": "",
             }
 
-        input_path = Path(input_file_path)
+        # Pathオブジェクトを作らず、os.pathの文字列操作で分解する
+        parent, name = os.path.split(os.path.normpath(input_file_path))
+        stem, suffix = os.path.splitext(name)
+        if suffix == ".":
+            # Path.suffixと同じく、末尾のドットは拡張子として扱わない
+            stem, suffix = name, ""
 
         # 出力ディレクトリの決定
-        output_dir = config.get("output_dir")
-        if output_dir:
-            output_dir_path = Path(output_dir)
-        else:
-            # 出力ディレクトリが未指定の場合は入力ファイルと同じディレクトリ
-            output_dir_path = input_path.parent
+        # 出力ディレクトリが未指定の場合は入力ファイルと同じディレクトリ
+        output_dir = config.get("output_dir") or parent
         # 出力ファイル名の決定
         output_suffix = config.get("output_suffix", "")
-        output_name = f"{input_path.stem}{output_suffix}{input_path.suffix}"
+        output_name = f"{stem}{output_suffix}{suffix}"
 
         # 完全な出力パス
-        output_path = output_dir_path / output_name
+        output_dir_abs = os.path.abspath(output_dir)
 
         return {
-            "output_path": str(output_path.absolute()),
-            "output_dir": str(output_dir_path.absolute()),
+            "output_path": os.path.join(output_dir_abs, output_name),
+            "output_dir": output_dir_abs,
             "output_name": output_name,
-            "output_basename": f"{input_path.stem}{output_suffix}",
+            "output_basename": f"{stem}{output_suffix}",
         }
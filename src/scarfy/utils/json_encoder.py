@@ -0,0 +1,69 @@
+"""出力用のJSONエンコード機能。
+
+出力コンポーネントが結果をJSON文字列に変換するためのヘルパーを提供します。
+orjson がインストールされている場合はそちらを使用し、ない場合は標準の json
+モジュールにフォールバックします。
+"""
+
+import json
+import math
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson なしの環境
+    orjson = None  # type: ignore
+
+# 標準jsonのエンコーダー（呼び出しごとに生成しないよう共有）
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+_PRETTY_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str, indent=2)
+
+if orjson is not None:
+    # datetime とデータクラスは標準jsonと同じく default=str で文字列化する
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def _differs_in_orjson(data: Any) -> bool:
+    """orjson と標準jsonで変換結果が異なる値を含むかを判定します。
+
+    orjson は Enum を値で、NaN・Infinity を null で出力しますが、標準jsonでは
+    str() の結果と NaN・Infinity になります。
+    """
+    if isinstance(data, dict):
+        return any(_differs_in_orjson(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_differs_in_orjson(item) for item in data)
+    if isinstance(data, Enum):
+        return True
+    return isinstance(data, float) and not math.isfinite(data)
+
+
+def dumps_json(data: Any, pretty: bool = False) -> str:
+    """データをJSON文字列に変換します。
+
+    非ASCII文字はエスケープせず、JSONで表現できない値は str() で文字列化します。
+    インデント付きの出力は orjson の有無にかかわらず同じ文字列になります。
+    コンパクト出力は、orjson 使用時は区切り文字の後に空白が入りません
+    （標準jsonでは ``", "`` と ``": "``）。デコード結果は同じです。
+
+    Args:
+        data: 変換するデータ
+        pretty: Trueの場合は2スペースでインデントする
+
+    Returns:
+        JSON文字列
+    """
+    if orjson is not None and not _differs_in_orjson(data):
+        option = (_ORJSON_OPTIONS | orjson.OPT_INDENT_2) if pretty else _ORJSON_OPTIONS
+        try:
+            return orjson.dumps(data, default=str, option=option).decode()
+        except TypeError:
+            # 64ビットを超える整数など orjson が扱えない値は標準jsonで変換する
+            pass
+    encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+    return encoder.encode(data)
@@ -4,10 +4,48 @@
 Python標準のloggingモジュールを使用し、シンプルで理解しやすい設定を提供します。
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+# 全ロガー共通のキューと書き出しスレッド（最初のsetup_logger呼び出しで開始）
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+
+
+def _ensure_listener() -> None:
+    """キューのレコードを標準出力に書き出すスレッドを開始する。
+
+    レコードはQueueHandlerで整形済みのため、ここではメッセージを
+    そのまま書き出します。終了時にはatexitで停止し、残りを出力します。
+    print などで標準出力に直接書き込む出力とは順序が前後することがあります。
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = QueueListener(_log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_stop_listener)
+
+
+def _stop_listener() -> None:
+    """書き出しスレッドを停止し、キューに残ったレコードを出力する。
+
+    停止後は _listener を None に戻し、次の _ensure_listener() で再開できるようにします。
+    """
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
+
 
 def setup_logger(
     name: Optional[str] = None, level: str = "INFO", format_string: Optional[str] = None
@@ -39,8 +77,10 @@ def setup_logger(
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     logger.setLevel(numeric_level)
 
-    # コンソールハンドラーを作成
-    console_handler = logging.StreamHandler(sys.stdout)
+    # コンソールハンドラーを作成（書き込みはバックグラウンドスレッドで行い、
+    # 呼び出し元はキューに積むだけで戻る）
+    _ensure_listener()
+    console_handler = QueueHandler(_log_queue)
     console_handler.setLevel(numeric_level)
 
     # フォーマッターを設定
@@ -8,7 +8,8 @@ ClaudeCodeAgentなどでMCPツールを使用する際の
 """
 
 import asyncio
-from typing import List, Dict
+import time
+from typing import List, Dict, Optional, Tuple
 from .logger import get_logger
 
 # モジュールレベルでロガーを定義
@@ -64,6 +65,13 @@ MCP_TOOLS_MAP = {
     ],  # , 'mcp__arxiv-mcp-server__read_paper'
 }
 
+# 設定確認のために同時に起動するclaudeプロセスの上限
+_MAX_CONCURRENT_CHECKS = 8
+
+# is_server_configured の結果キャッシュ（サーバー名 -> (設定済みか, 取得時刻)）
+_configured_cache: Dict[str, Tuple[bool, float]] = {}
+_CACHE_TTL = 60.0  # 秒
+
 # MCPサーバーの起動コマンドマッピング
 MCP_SERVER_COMMANDS = {
     "arxiv-mcp-server": [
@@ -90,7 +98,7 @@ class MCPToolsManager:
             server_names: MCPサーバー名のリスト
 
         Returns:
-            利用可能なツール名のリスト（重複除去済み）
+            利用可能なツール名のリスト（重複除去済み、サーバーの指定順）
         """
         if not server_names:
             return []
@@ -112,7 +120,7 @@ class MCPToolsManager:
                     server,
                 )
 
-        return list(set(all_tools))  # 重複を除去
+        return list(dict.fromkeys(all_tools))  # 出現順を保ったまま重複を除去
 
     @staticmethod
     def add_server_mapping(server_name: str, tools: List[str]) -> None:
@@ -158,12 +166,26 @@ class MCPToolsManager:
         Returns:
             サーバー名と設定成功状態の辞書（True=成功、False=失敗）
         """
+        # 設定済みかの確認（claude mcp get）は互いに独立しているため並行実行する
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_CHECKS)
+
+        async def _check(server_name: str) -> bool:
+            async with semaphore:
+                return await MCPToolsManager.is_server_configured(server_name)
+
+        configured = await asyncio.gather(
+            *(_check(s) for s in server_names), return_exceptions=True
+        )
+
         results = {}
 
-        for server_name in server_names:
+        # 追加（claude mcp add）はCLIの設定ファイルを書き換えるため1つずつ実行する
+        for server_name, is_configured in zip(server_names, configured):
             try:
                 # 1. 既に設定されているかチェック
-                if await MCPToolsManager.is_server_configured(server_name):
+                if isinstance(is_configured, BaseException):
+                    raise is_configured
+                if is_configured:
                     logger.debug("MCP %s は既に設定済みです", server_name)
                     results[server_name] = True
                     continue
@@ -198,30 +220,52 @@ class MCPToolsManager:
     async def is_server_configured(server_name: str) -> bool:
         """指定されたMCPサーバーが設定されているかチェック。
 
+        結果は_CACHE_TTL秒の間キャッシュされ、その間は
+        claude mcp get を実行しません。
+
         Args:
             server_name: MCPサーバー名
 
         Returns:
             設定されている場合True、されていない場合False
         """
+        cached = _configured_cache.get(server_name)
+        if cached is not None and time.monotonic() - cached[1] < _CACHE_TTL:
+            return cached[0]
+
         try:
             process = await asyncio.create_subprocess_exec(
                 "claude",
                 "mcp",
                 "get",
                 server_name,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+                # 終了コードだけを見るため出力は読み捨てる
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
 
-            stdout, stderr = await process.communicate()
+            await process.wait()
 
             # exit code 0 = サーバーが存在
-            return process.returncode == 0
+            configured = process.returncode == 0
+            _configured_cache[server_name] = (configured, time.monotonic())
+            return configured
 
         except Exception:
             return False
 
+    @staticmethod
+    def invalidate_cache(server_name: Optional[str] = None) -> None:
+        """is_server_configured の結果キャッシュを破棄。
+
+        Args:
+            server_name: 破棄するサーバー名。Noneの場合は全て破棄します。
+        """
+        if server_name is None:
+            _configured_cache.clear()
+        else:
+            _configured_cache.pop(server_name, None)
+
     @staticmethod
     async def add_server(server_name: str, command: List[str]) -> None:
         """MCPサーバーをClaude Code CLIに追加。
@@ -245,6 +289,7 @@ class MCPToolsManager:
             stdout, stderr = await process.communicate()
 
             if process.returncode == 0:
+                _configured_cache[server_name] = (True, time.monotonic())
                 logger.info("MCP %s を追加しました: %s", server_name, " ".join(command))
             else:
                 stderr_text = stderr.decode()
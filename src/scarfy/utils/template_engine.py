@@ -4,11 +4,26 @@
 テンプレート用コンテキストの構築を担当します。
 """
 
+import functools
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from ..core.events import Event
 
+# {key} 形式のプレースホルダー
+_PLACEHOLDER_RE = re.compile(r"\{([^}]+)\}")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_template(template: str) -> Tuple[str, ...]:
+    """テンプレートをリテラル部分とキーに分割する（テンプレート文字列ごとにキャッシュ）。
+
+    戻り値は偶数番目がリテラル文字列、奇数番目がプレースホルダーのキーとなる
+    タプルです。同じテンプレートはイベントごとに再パースされません。
+    """
+    return tuple(_PLACEHOLDER_RE.split(template))
+
 
 class TemplateEngine:
     """プロンプトテンプレートの処理を担当するクラス。
@@ -43,19 +58,20 @@ class TemplateEngine:
         Returns:
             プレースホルダーが置換された文字列
         """
-        import re
-
-        def replacement_func(match: Any) -> str:
-            key = match.group(1)
-            if key in context:
-                return str(context[key])
-            else:
-                return f"{{MISSING:{key}}}"
+        if "{" not in template:
+            # プレースホルダーを含まない固定のプロンプトはそのまま返す
+            return template
 
         try:
-            # {key}形式のプレースホルダーを全て見つけて置換
-            result = re.sub(r"\{([^}]+)\}", replacement_func, template)
-            return result
+            # コンパイル済みのテンプレートを使い、キーの部分だけを置換
+            parts = list(_compile_template(template))
+            for i in range(1, len(parts), 2):
+                key = parts[i]
+                if key in context:
+                    parts[i] = str(context[key])
+                else:
+                    parts[i] = f"{{MISSING:{key}}}"
+            return "".join(parts)
         except Exception:
             # その他のエラーの場合、元のテンプレートを返す
             return template
@@ -83,29 +99,32 @@ class TemplateEngine:
         Returns:
             テンプレート置換に使用できるコンテキスト辞書
         """
-        # イベントデータをベースにする
-        context = dict(event.data)
-
-        # ファイルパス関連の情報を追加
+        # ファイルパス関連の情報
+        file_fields: Dict[str, Any] = {}
         if file_path:
-            context.update(
-                {
-                    "file_name": file_path.stem,  # 拡張子なしファイル名
-                    "file_extension": file_path.suffix,  # 拡張子（.含む）
-                    "file_path": str(file_path.absolute()),  # 絶対パス
-                    "file_basename": file_path.name,  # ファイル名（拡張子含む）
-                }
-            )
+            # name を1回だけ取り出し、Path.stem/suffix と同じ規則で分割する
+            name = file_path.name
+            dot = name.rfind(".")
+            if 0 < dot < len(name) - 1:
+                stem, suffix = name[:dot], name[dot:]
+            else:
+                stem, suffix = name, ""
+            file_fields = {
+                "file_name": stem,  # 拡張子なしファイル名
+                "file_extension": suffix,  # 拡張子（.含む）
+                "file_path": str(file_path.absolute()),  # 絶対パス
+                "file_basename": name,  # ファイル名（拡張子含む）
+            }
 
             # ファイル内容が提供されている場合は追加
             if file_content is not None:
-                context["file_content"] = file_content
-
-        # イベントタイプを追加
-        context["event_type"] = event.type
-
-        # 出力パス情報を追加
-        if output_paths:
-            context.update(output_paths)
-
-        return context
+                file_fields["file_content"] = file_content
+
+        # イベントデータをベースに、ファイル情報・イベントタイプ・出力パス情報の
+        # 順で上書きしたコンテキストを1つの辞書リテラルで構築する
+        return {
+            **event.data,
+            **file_fields,
+            "event_type": event.type,
+            **(output_paths or {}),
+        }
@@ -1,6 +1,8 @@
 """ClaudeCodeAgent の MCP サーバー自動設定統合テスト。"""
 
+import asyncio
 import pytest
+import sys
 from unittest.mock import Mock, patch
 from datetime import datetime
 
@@ -295,3 +297,90 @@ class TestClaudeCodeMCPIntegration:
             assert (
                 "arxiv-mcp-server" not in agent._mcp_servers_initialized
             )  # 例外発生時はサーバーが記録されないこと
+
+
+class TestClaudeCodeExecution:
+    """ClaudeCodeAgent の CLI 実行部分のテスト。"""
+
+    @pytest.fixture
+    def fake_claude(self, tmp_path):
+        """パイプバッファを超える stdout/stderr を出力する Claude Code CLI の代用。
+
+        stdout には読み取りチャンクの境界をまたぐマルチバイト文字の長い行も含む。
+        """
+        script = tmp_path / "fake_claude"
+        script.write_text(
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            "sys.stderr.write('e' * 200000)\n"
+            "sys.stdout.write(('x' * 99 + '\\n') * 1000)\n"
+            "sys.stdout.write('あ' * 50000 + '\\n')\n"
+            "print('完了')\n"
+        )
+        script.chmod(0o755)
+        return script
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("realtime", [True, False])
+    async def test_large_output_does_not_block(self, fake_claude, tmp_path, realtime):
+        """パイプバッファを超える出力でも実行が完了することをテスト。"""
+        agent = ClaudeCodeAgent()
+        config = {
+            "claude_path": str(fake_claude),
+            "timeout": 10,
+            "show_realtime_output": realtime,
+        }
+
+        output, execution_time = await agent._execute_claude_code(
+            "prompt", tmp_path / "input.txt", config
+        )
+
+        assert output.endswith("あ" * 50000 + "\n完了\n")
+        assert "\ufffd" not in output
+        assert len(output) == 100 * 1000 + 50001 + len("完了\n")
+        assert execution_time >= 0
+
+    @pytest.mark.asyncio
+    async def test_argv_template_is_cached(self, tmp_path):
+        """CLI引数が設定ごとにキャッシュされ、プロンプトだけが差し替わることをテスト。"""
+        script = tmp_path / "echo_argv"
+        script.write_text(
+            f"#!{sys.executable}\n" "import sys\n" "print('|'.join(sys.argv[1:]))\n"
+        )
+        script.chmod(0o755)
+        agent = ClaudeCodeAgent()
+        config = {
+            "claude_path": str(script),
+            "additional_tools": ["Bash"],
+            "verbose": True,
+            "show_realtime_output": False,
+        }
+
+        first, _ = await agent._execute_claude_code(
+            "first", tmp_path / "input.txt", config
+        )
+        second, _ = await agent._execute_claude_code(
+            "second", tmp_path / "input.txt", config
+        )
+
+        assert first.strip() == (
+            "--allowedTools|Edit|Write|Read|Bash|--print|first"
+            "|--verbose|--output-format|stream-json"
+        )
+        assert second.strip() == (
+            "--allowedTools|Edit|Write|Read|Bash|--print|second"
+            "|--verbose|--output-format|stream-json"
+        )
+        assert len(agent._argv_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process(self, tmp_path):
+        """タイムアウト時にプロセスが終了され、TimeoutErrorが送出されることをテスト。"""
+        script = tmp_path / "slow_claude"
+        script.write_text(f"#!{sys.executable}\n" "import time\n" "time.sleep(30)\n")
+        script.chmod(0o755)
+        agent = ClaudeCodeAgent()
+        config = {"claude_path": str(script), "timeout": 0.2}
+
+        with pytest.raises(asyncio.TimeoutError):
+            await agent._execute_claude_code("prompt", tmp_path / "input.txt", config)
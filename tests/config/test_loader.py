@@ -184,3 +184,34 @@ workflows:
 
             # クリーンアップ
             Path(f.name).unlink()
+
+    @pytest.mark.asyncio
+    async def test_load_config_async(self, tmp_path: Path) -> None:
+        """非同期版の設定読み込みが同期版と同じ結果を返すことをテスト。"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text('workflows:\n  - name: "async"\n', encoding="utf-8")
+
+        result = await self.loader.load_config_async(config_file)
+
+        assert result == self.loader.load_config(config_file)
+        assert result["workflows"][0]["name"] == "async"
+
+    def test_load_config_returns_independent_copies(self, tmp_path: Path) -> None:
+        """キャッシュされた設定を変更しても次回の読み込みに影響しないことをテスト。"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("settings:\n  debug: true\n", encoding="utf-8")
+
+        first = self.loader.load_config(config_file)
+        first["settings"]["debug"] = False
+
+        second = self.loader.load_config(config_file)
+        assert second["settings"]["debug"] is True
+
+    def test_load_config_reloads_modified_file(self, tmp_path: Path) -> None:
+        """ファイルが更新された場合に再読み込みされることをテスト。"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("value: 1\n", encoding="utf-8")
+        assert self.loader.load_config(config_file) == {"value": 1}
+
+        config_file.write_text("value: 1000\n", encoding="utf-8")
+        assert self.loader.load_config(config_file) == {"value": 1000}
@@ -10,6 +10,7 @@ from unittest.mock import Mock, AsyncMock
 from src.scarfy.core.engine import ScarfyEngine, Workflow
 from src.scarfy.core.events import Event
 from src.scarfy.core.interfaces import Trigger, Agent, Output
+from src.scarfy.triggers.manual import ManualTrigger
 
 
 class MockTrigger(Trigger):
@@ -160,6 +161,25 @@ class TestScarfyEngine:
         assert len(self.engine.workflows) == 1
         assert self.engine.workflows[0] is workflow
 
+    def test_add_workflow_resolves_components(self):
+        """ワークフロー追加時とその後の登録でコンポーネントが解決されることをテスト。"""
+        self.engine.register_agent("test_agent", self.mock_agent)
+        workflow = Workflow(
+            name="test_workflow",
+            trigger_config={"type": "test_trigger", "event_type": "test_event"},
+            agent_config={"type": "test_agent"},
+            output_config={"type": "test_output"},
+        )
+
+        self.engine.add_workflow(workflow)
+
+        assert workflow._agent is self.mock_agent
+        assert workflow._output is None
+
+        # 後から登録された出力も解決される
+        self.engine.register_output("test_output", self.mock_output)
+        assert workflow._output is self.mock_output
+
     @pytest.mark.asyncio
     async def test_start_with_registered_components(self):
         """登録されたコンポーネントでのエンジン開始をテスト。"""
@@ -197,6 +217,86 @@ class TestScarfyEngine:
         assert not self.engine._running
         assert self.mock_trigger.stopped
 
+    @pytest.mark.asyncio
+    async def test_shared_trigger_started_once(self):
+        """複数のワークフローが同じトリガーを使う場合に一度だけ開始されることをテスト。"""
+        self.mock_trigger.start = AsyncMock()
+        self.engine.register_trigger("test_trigger", self.mock_trigger)
+
+        for i in range(3):
+            self.engine.add_workflow(
+                Workflow(
+                    name=f"workflow_{i}",
+                    trigger_config={"type": "test_trigger", "event_type": f"e{i}"},
+                    agent_config={"type": "test_agent"},
+                    output_config={"type": "test_output"},
+                )
+            )
+
+        engine_task = asyncio.create_task(self.engine.start())
+        await asyncio.sleep(0.1)
+        await self.engine.stop()
+        await asyncio.wait_for(engine_task, timeout=2.0)
+
+        self.mock_trigger.start.assert_awaited_once()
+        _, config = self.mock_trigger.start.await_args.args
+        assert config["event_type"] == "e0"
+
+    @pytest.mark.asyncio
+    async def test_workflow_without_event_type_uses_trigger_default(self):
+        """event_type未指定のワークフローがトリガーの既定イベントタイプを購読することをテスト。"""
+        trigger = ManualTrigger()
+        self.engine.register_trigger("manual", trigger)
+        self.engine.register_agent("test_agent", self.mock_agent)
+        self.engine.register_output("test_output", self.mock_output)
+
+        self.engine.add_workflow(
+            Workflow(
+                name="manual_workflow",
+                trigger_config={"type": "manual"},
+                agent_config={"type": "test_agent"},
+                output_config={"type": "test_output"},
+            )
+        )
+
+        engine_task = asyncio.create_task(self.engine.start())
+        await asyncio.sleep(0.05)
+        await trigger.trigger({"test": "data"})
+        await asyncio.sleep(0.05)
+        await self.engine.stop()
+        await asyncio.wait_for(engine_task, timeout=1.0)
+
+        assert len(self.mock_agent.processed_events) == 1
+        event, _ = self.mock_agent.processed_events[0]
+        assert event.type == ManualTrigger.default_event_type
+
+    @pytest.mark.asyncio
+    async def test_trigger_registered_after_workflow_uses_its_default(self):
+        """ワークフロー追加後に登録されたトリガーの既定イベントタイプで購読することをテスト。"""
+        self.engine.register_agent("test_agent", self.mock_agent)
+        self.engine.register_output("test_output", self.mock_output)
+        self.engine.add_workflow(
+            Workflow(
+                name="manual_workflow",
+                trigger_config={"type": "manual"},
+                agent_config={"type": "test_agent"},
+                output_config={"type": "test_output"},
+            )
+        )
+
+        trigger = ManualTrigger()
+        self.engine.register_trigger("manual", trigger)
+
+        engine_task = asyncio.create_task(self.engine.start())
+        await asyncio.sleep(0.05)
+        await trigger.trigger({"test": "data"})
+        await asyncio.sleep(0.05)
+        await self.engine.stop()
+        await asyncio.wait_for(engine_task, timeout=1.0)
+
+        assert len(self.mock_agent.processed_events) == 1
+        assert not self.engine._workflow_callbacks[Trigger.default_event_type]
+
     @pytest.mark.asyncio
     async def test_start_with_unregistered_trigger(self):
         """未登録のトリガーでのエンジン開始エラーをテスト。"""
@@ -380,6 +480,9 @@ class TestScarfyEngine:
         # 両方の結果が出力に送信されたことを確認
         assert len(self.mock_output.sent_data) == 2
 
+        # 同じイベントタイプのワークフローはイベントバスへの購読を共有する
+        assert len(self.engine.event_bus._subscribers["test_event"]) == 1
+
     @pytest.mark.asyncio
     async def test_agent_exception_handling(self):
         """エージェントで例外が発生した場合の処理をテスト。"""
@@ -418,3 +521,51 @@ class TestScarfyEngine:
         # エージェントは呼ばれたが、出力は呼ばれない（例外のため）
         failing_agent.process.assert_called_once()
         assert len(self.mock_output.sent_data) == 0
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_workflows(self):
+        """ワークフローの同時実行数が制限されることをテスト。"""
+        engine = ScarfyEngine(max_concurrent_workflows=2)
+        active = 0
+        max_active = 0
+
+        class SlowAgent(Agent):
+            async def process(self, event, config):
+                nonlocal active, max_active
+                active += 1
+                max_active = max(max_active, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return {"status": "success"}
+
+        engine.register_trigger("test_trigger", self.mock_trigger)
+        engine.register_agent("slow_agent", SlowAgent())
+        engine.register_output("test_output", self.mock_output)
+        engine.add_workflow(
+            Workflow(
+                name="slow_workflow",
+                trigger_config={"type": "test_trigger", "event_type": "test_event"},
+                agent_config={"type": "slow_agent"},
+                output_config={"type": "test_output"},
+            )
+        )
+
+        callback = engine._workflow_callbacks["test_event"][0]
+        events = [
+            Event(id=str(i), type="test_event", data={}, timestamp=None, source="test")
+            for i in range(5)
+        ]
+        await asyncio.gather(*(callback(event) for event in events))
+
+        assert max_active == 2
+        assert len(self.mock_output.sent_data) == 5
+
+        # コールバックを経由せずに直接実行しても同じ上限が適用される
+        max_active = 0
+        workflow = engine.workflows[0]
+        await asyncio.gather(
+            *(engine._process_workflow(workflow, event) for event in events)
+        )
+
+        assert max_active == 2
+        assert len(self.mock_output.sent_data) == 10
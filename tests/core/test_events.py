@@ -5,7 +5,10 @@ EventクラスとEventBusクラスの機能を検証します。
 
 import pytest
 import asyncio
+import threading
 from datetime import datetime
+from unittest.mock import Mock, patch
+from src.scarfy.core import events as events_module
 from src.scarfy.core.events import Event, EventBus
 
 
@@ -38,9 +41,19 @@ class TestEvent:
 
         assert event.id != ""
         assert len(event.id) > 0
-        # UUIDの形式を簡単に確認
+        # "<プレフィックス>-<連番>" の形式を簡単に確認
         assert "-" in event.id
 
+    def test_event_ids_share_prefix_and_increment(self):
+        """自動生成IDが同じプレフィックスと増加する連番を持つことをテスト。"""
+        event1 = Event(id="", type="test", data={}, timestamp=None, source="test")
+        event2 = Event(id="", type="test", data={}, timestamp=None, source="test")
+
+        prefix1, seq1 = event1.id.rsplit("-", 1)
+        prefix2, seq2 = event2.id.rsplit("-", 1)
+        assert prefix1 == prefix2
+        assert int(seq2) > int(seq1)
+
     def test_event_auto_generates_timestamp_when_none(self):
         """timestampがNoneの場合に自動生成されることをテスト。"""
         before_creation = datetime.now()
@@ -60,6 +73,30 @@ class TestEvent:
 
         assert event1.id != event2.id
 
+    def test_event_with_data(self):
+        """with_dataがdataだけを差し替えた新しいEventを返すことをテスト。"""
+        event = Event(
+            id="test", type="test", data={"a": 1}, timestamp=None, source="test"
+        )
+
+        new_event = event.with_data({"b": 2})
+
+        assert new_event is not event
+        assert new_event.data == {"b": 2}
+        assert event.data == {"a": 1}
+        assert new_event.id == event.id
+        assert new_event.type == event.type
+        assert new_event.timestamp == event.timestamp
+        assert new_event.source == event.source
+
+    def test_event_uses_slots(self):
+        """Eventがインスタンス辞書を持たないことをテスト。"""
+        event = Event(id="", type="test", data={}, timestamp=None, source="test")
+
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.extra = "value"
+
     def test_event_immutable_data_structure(self):
         """Eventがイミュータブルなデータ構造であることをテスト。"""
         data = {"key": "value"}
@@ -333,3 +370,241 @@ class TestEventBus:
             pytest.fail("EventBus task did not stop within timeout")
 
         assert not self.event_bus._running
+
+    @pytest.mark.asyncio
+    async def test_stop_returns_immediately(self):
+        """stop()後にstart()が即座に終了することをテスト。"""
+        bus_task = asyncio.create_task(self.event_bus.start())
+        await asyncio.sleep(0)
+
+        self.event_bus.stop()
+
+        await asyncio.wait_for(bus_task, timeout=0.1)
+        assert not self.event_bus._running
+
+    @pytest.mark.asyncio
+    async def test_publish_does_not_wait_for_subscribers(self):
+        """publish()が購読者の処理完了を待たずに戻ることをテスト。"""
+        release = asyncio.Event()
+        received_events = []
+
+        async def slow_callback(event):
+            await release.wait()
+            received_events.append(event)
+
+        self.event_bus.subscribe("test_event", slow_callback)
+        test_event = Event(
+            id="test", type="test_event", data={}, timestamp=None, source="test"
+        )
+
+        await asyncio.wait_for(self.event_bus.publish(test_event), timeout=0.1)
+        assert received_events == []
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert len(received_events) == 1
+
+    @pytest.mark.asyncio
+    async def test_eager_dispatch_is_opt_in(self):
+        """eager タスクファクトリが eager_dispatch 指定時だけ使われることをテスト。"""
+        received_events = []
+
+        async def callback(event):
+            received_events.append(event)
+
+        def fake_eager_factory(loop, coro):
+            # Python 3.11 でも eager 経路を通せるよう通常のタスクで代用する
+            task = loop.create_task(coro)
+            received_events.append("eager")
+            return task
+
+        test_event = Event(
+            id="test", type="test_event", data={}, timestamp=None, source="test"
+        )
+        factory = Mock(side_effect=fake_eager_factory)
+        with patch.object(events_module, "_eager_task_factory", factory):
+            self.event_bus.subscribe("test_event", callback)
+            await self.event_bus.publish(test_event)
+            factory.assert_not_called()
+
+            eager_bus = EventBus(eager_dispatch=True)
+            eager_bus.subscribe("test_event", callback)
+            await eager_bus.publish(test_event)
+            factory.assert_called_once()
+
+        await asyncio.sleep(0.01)
+        assert received_events.count(test_event) == 2
+        assert received_events.count("eager") == 1
+
+    @pytest.mark.asyncio
+    async def test_max_pending_applies_back_pressure(self):
+        """ディスパッチ数が上限に達するとpublish()が空きを待つことをテスト。"""
+        bus = EventBus(max_pending=2)
+        release = asyncio.Event()
+
+        async def slow_callback(event):
+            await release.wait()
+
+        bus.subscribe("test_event", slow_callback)
+        events = [
+            Event(id=str(i), type="test_event", data={}, timestamp=None, source="t")
+            for i in range(3)
+        ]
+
+        await bus.publish(events[0])
+        await bus.publish(events[1])
+        third = asyncio.create_task(bus.publish(events[2]))
+        await asyncio.sleep(0.01)
+        assert not third.done()
+        assert len(bus._pending) == 2
+
+        release.set()
+        await asyncio.wait_for(third, timeout=0.1)
+        await asyncio.sleep(0.01)
+        assert not bus._pending
+
+    @pytest.mark.asyncio
+    async def test_sync_callback_runs_in_bus_executor(self):
+        """同期コールバックがバス専用のスレッドプールで実行されることをテスト。"""
+        thread_names = []
+
+        def sync_callback(event):
+            thread_names.append(threading.current_thread().name)
+
+        self.event_bus.subscribe("test_event", sync_callback)
+        test_event = Event(
+            id="test", type="test_event", data={}, timestamp=None, source="test"
+        )
+
+        await self.event_bus._process_event(test_event)
+
+        assert len(thread_names) == 1
+        assert thread_names[0].startswith("scarfy-sync")
+
+        # stop()でスレッドプールが解放される
+        self.event_bus.stop()
+        assert self.event_bus._executor is None
+
+    @pytest.mark.asyncio
+    async def test_single_subscriber_skips_gather(self):
+        """購読者が1つの場合はgatherを使わずに直接実行されることをテスト。"""
+        received_events = []
+
+        async def callback(event):
+            received_events.append(event)
+
+        async def failing_callback(event):
+            raise Exception("Test exception")
+
+        self.event_bus.subscribe("test_event", callback)
+        self.event_bus.subscribe("failing_event", failing_callback)
+
+        with patch("src.scarfy.core.events.asyncio.gather") as mock_gather:
+            await self.event_bus._process_event(
+                Event(id="1", type="test_event", data={}, timestamp=None, source="t")
+            )
+            # 購読者の例外は呼び出し元に伝播しない
+            await self.event_bus._process_event(
+                Event(id="2", type="failing_event", data={}, timestamp=None, source="t")
+            )
+
+        mock_gather.assert_not_called()
+        assert len(received_events) == 1
+
+    @pytest.mark.asyncio
+    async def test_wildcard_subscription(self):
+        """ "*" で購読したコールバックがすべてのイベントを受信することをテスト。"""
+        all_events = []
+        target_events = []
+
+        async def wildcard_callback(event):
+            all_events.append(event)
+
+        async def target_callback(event):
+            target_events.append(event)
+
+        self.event_bus.subscribe("*", wildcard_callback)
+        self.event_bus.subscribe("target_event", target_callback)
+
+        await self.event_bus._process_event(
+            Event(id="1", type="target_event", data={}, timestamp=None, source="t")
+        )
+        await self.event_bus._process_event(
+            Event(id="2", type="other_event", data={}, timestamp=None, source="t")
+        )
+
+        assert [e.id for e in all_events] == ["1", "2"]
+        assert [e.id for e in target_events] == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_callback_exception_is_logged(self):
+        """購読者の例外がログに記録されることをテスト。"""
+
+        async def failing_callback(event):
+            raise Exception("Test exception")
+
+        async def working_callback(event):
+            pass
+
+        self.event_bus.subscribe("single_event", failing_callback)
+        self.event_bus.subscribe("multi_event", failing_callback)
+        self.event_bus.subscribe("multi_event", working_callback)
+
+        with patch("src.scarfy.core.events.logger") as mock_logger:
+            await self.event_bus._process_event(
+                Event(id="1", type="single_event", data={}, timestamp=None, source="t")
+            )
+            await self.event_bus._process_event(
+                Event(id="2", type="multi_event", data={}, timestamp=None, source="t")
+            )
+
+        mock_logger.exception.assert_called_once()
+        mock_logger.error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_subscribe_during_dispatch_does_not_affect_current_event(self):
+        """ディスパッチ中に購読を追加しても処理中のイベントに影響しないことをテスト。"""
+        calls = []
+
+        async def late_callback(event):
+            calls.append(("late", event.id))
+
+        async def subscribing_callback(event):
+            calls.append(("first", event.id))
+            self.event_bus.subscribe("test_event", late_callback)
+
+        async def other_callback(event):
+            calls.append(("other", event.id))
+
+        self.event_bus.subscribe("test_event", subscribing_callback)
+        self.event_bus.subscribe("test_event", other_callback)
+
+        await self.event_bus._process_event(
+            Event(id="1", type="test_event", data={}, timestamp=None, source="t")
+        )
+
+        assert ("late", "1") not in calls
+        assert isinstance(self.event_bus._subscribers["test_event"], tuple)
+        assert len(self.event_bus._subscribers["test_event"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_subscribers_called_in_priority_order(self):
+        """購読者が優先度順（同じ優先度は購読順）に呼び出されることをテスト。"""
+        calls = []
+
+        def make_callback(name):
+            async def callback(event):
+                calls.append(name)
+
+            return callback
+
+        self.event_bus.subscribe("test_event", make_callback("default"))
+        self.event_bus.subscribe("test_event", make_callback("late"), priority=10)
+        self.event_bus.subscribe("test_event", make_callback("early"), priority=-10)
+        self.event_bus.subscribe("test_event", make_callback("default2"))
+
+        await self.event_bus._process_event(
+            Event(id="1", type="test_event", data={}, timestamp=None, source="t")
+        )
+
+        assert calls == ["early", "default", "default2", "late"]
@@ -141,6 +141,33 @@ class TestAgentInterface:
         assert result["data"]["file_path"] == "/tmp/test.txt"
         assert result["timeout"] == 60
 
+    @pytest.mark.asyncio
+    async def test_process_many_limits_concurrency(self):
+        """process_manyが順序を保ち、同時実行数を制限することをテスト。"""
+
+        class SlowAgent(Agent):
+            def __init__(self):
+                self.active = 0
+                self.max_active = 0
+
+            async def process(self, event, config):
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                await asyncio.sleep(0.01)
+                self.active -= 1
+                return {"id": event.id}
+
+        agent = SlowAgent()
+        events = [
+            Event(id=str(i), type="test", data={}, timestamp=None, source="test")
+            for i in range(10)
+        ]
+
+        results = await agent.process_many(events, {}, concurrency=3)
+
+        assert [r["id"] for r in results] == [str(i) for i in range(10)]
+        assert agent.max_active == 3
+
     def test_incomplete_agent_implementation(self):
         """不完全なAgent実装でのエラーをテスト。"""
 
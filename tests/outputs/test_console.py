@@ -0,0 +1,62 @@
+"""ConsoleOutputクラスのテストモジュール。
+
+コンソールへの出力フォーマットのテストを提供します。
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.scarfy.outputs import console as console_module
+from src.scarfy.outputs.console import ConsoleOutput
+
+
+class TestConsoleOutput:
+    """ConsoleOutputクラスのテストケース。"""
+
+    def setup_method(self):
+        """各テストメソッド実行前の初期化。"""
+        self.output = ConsoleOutput()
+
+    @pytest.mark.asyncio
+    async def test_send_pretty(self, capsys):
+        """整形出力ではプレフィックスが別行に印刷されることをテスト。"""
+        await self.output.send({"status": "ok"}, {"prefix": "[TEST]"})
+
+        assert capsys.readouterr().out == '[TEST]\n{\n  "status": "ok"\n}\n'
+
+    @pytest.mark.asyncio
+    async def test_send_compact_with_timestamp(self, capsys):
+        """コンパクト出力ではプレフィックスとタイムスタンプが同じ行に印刷されることをテスト。"""
+        config = {"prefix": "[TEST]", "pretty": False, "timestamp": True}
+
+        await self.output.send({"status": "ok"}, config)
+
+        out = capsys.readouterr().out
+        assert out.startswith("[TEST] 20")
+        assert out.rstrip().endswith("}")
+        assert out.count("\n") == 1
+
+    @pytest.mark.asyncio
+    async def test_formatter_cached_per_config(self, capsys):
+        """同じ設定辞書では整形関数が再利用されることをテスト。"""
+        config = {"prefix": "[A]", "pretty": False}
+
+        await self.output.send({"n": 1}, config)
+        formatter = self.output._formatters[id(config)][1]
+        await self.output.send({"n": 2}, config)
+
+        assert self.output._formatters[id(config)][1] is formatter
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].startswith("[A] ") and lines[1].startswith("[A] ")
+
+    def test_format_now_reuses_string_within_second(self):
+        """同じ秒の間はタイムスタンプ文字列が再利用されることをテスト。"""
+        with patch.object(console_module.time, "time", return_value=1_700_000_000.2):
+            first = console_module._format_now()
+        with patch.object(console_module.time, "time", return_value=1_700_000_000.9):
+            with patch.object(console_module, "datetime") as mock_datetime:
+                second = console_module._format_now()
+
+        assert first == second
+        mock_datetime.fromtimestamp.assert_not_called()
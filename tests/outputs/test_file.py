@@ -0,0 +1,143 @@
+"""FileOutputクラスのテストモジュール。
+
+ファイルへの書き込みと、同じファイルへの書き込みのまとめ処理の
+テストを提供します。
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.scarfy.outputs import file as file_module
+from src.scarfy.outputs.file import FileOutput
+
+
+class TestFileOutput:
+    """FileOutputクラスのテストケース。"""
+
+    def setup_method(self):
+        """各テストメソッド実行前の初期化。"""
+        self.output = FileOutput()
+
+    @pytest.mark.asyncio
+    async def test_send_jsonl_append(self, tmp_path):
+        """JSONL形式で追記されることをテスト。"""
+        path = tmp_path / "logs" / "out.jsonl"
+        config = {"path": str(path), "format": "jsonl", "include_timestamp": False}
+
+        await self.output.send({"n": 1}, config)
+        await self.output.send({"n": 2}, config)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [{"n": 1}, {"n": 2}]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_are_batched_in_order(self, tmp_path):
+        """同時に送信されたエントリが順序を保ってまとめて書き込まれることをテスト。"""
+        path = tmp_path / "out.jsonl"
+        config = {"path": str(path), "format": "jsonl", "include_timestamp": False}
+
+        with patch.object(
+            file_module, "_write_text", wraps=file_module._write_text
+        ) as mock_write:
+            await asyncio.gather(
+                *(self.output.send({"n": i}, config) for i in range(10))
+            )
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["n"] for line in lines] == list(range(10))
+        assert mock_write.call_count == 1
+        assert not self.output._writers
+        assert not self.output._queues
+
+    @pytest.mark.asyncio
+    async def test_overwrite_in_batch_keeps_sequential_result(self, tmp_path):
+        """バッチ内の上書きエントリが順に書き込んだ場合と同じ結果になることをテスト。"""
+        path = tmp_path / "out.jsonl"
+        path.write_text("old\n", encoding="utf-8")
+        append = {"path": str(path), "format": "jsonl", "include_timestamp": False}
+        overwrite = {**append, "append": False}
+
+        await asyncio.gather(
+            self.output.send({"n": 1}, append),
+            self.output.send({"n": 2}, overwrite),
+            self.output.send({"n": 3}, append),
+        )
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["n"] for line in lines] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_write_error_propagates_to_sender(self, tmp_path):
+        """書き込みエラーが送信元に伝わることをテスト。"""
+        config = {"path": str(tmp_path), "format": "jsonl"}
+
+        with pytest.raises(OSError):
+            await self.output.send({"n": 1}, config)
+        assert not self.output._writers
+        assert not self.output._queues
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_propagates_to_sender(self, tmp_path):
+        """想定外の例外もキャンセルではなくその例外として送信元に伝わることをテスト。"""
+        config = {"path": str(tmp_path / "out.jsonl"), "format": "jsonl"}
+
+        with patch.object(file_module, "_write_text", side_effect=RuntimeError("boom")):
+            results = await asyncio.gather(
+                self.output.send({"n": 1}, config),
+                self.output.send({"n": 2}, config),
+                return_exceptions=True,
+            )
+
+        assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+        assert not self.output._writers
+        assert not self.output._queues
+
+    @pytest.mark.asyncio
+    async def test_state_does_not_grow_with_distinct_paths(self, tmp_path):
+        """異なるパスへの書き込みを繰り返してもパスごとの状態が残らないことをテスト。"""
+        for i in range(file_module._MAX_CACHED_SETTINGS + 10):
+            config = {"path": str(tmp_path / f"out_{i}.jsonl"), "format": "jsonl"}
+            await self.output.send({"n": i}, config)
+
+        assert not self.output._queues
+        assert not self.output._writers
+        assert len(self.output._settings) <= file_module._MAX_CACHED_SETTINGS
+
+    @pytest.mark.asyncio
+    async def test_send_with_timestamp_wrapper(self, tmp_path):
+        """タイムスタンプ付きの出力がラッパー形式になることをテスト。"""
+        path = tmp_path / "out.jsonl"
+
+        await self.output.send({"n": 1}, {"path": str(path), "format": "jsonl"})
+        await self.output.send(
+            {"n": 2}, {"path": str(path), "format": "json", "pretty": True}
+        )
+
+        compact, pretty = path.read_text(encoding="utf-8").split("\n", 1)
+        entry = json.loads(compact)
+        assert set(entry) == {"timestamp", "data"}
+        assert entry["data"] == {"n": 1}
+        assert datetime.fromisoformat(entry["timestamp"])
+        assert json.loads(pretty)["data"] == {"n": 2}
+
+    @pytest.mark.asyncio
+    async def test_pretty_ignored_for_jsonl(self, tmp_path):
+        """JSONL形式ではprettyが無視され1行で書き込まれることをテスト。"""
+        path = tmp_path / "out.jsonl"
+        config = {
+            "path": str(path),
+            "format": "jsonl",
+            "pretty": True,
+            "include_timestamp": False,
+        }
+
+        await self.output.send({"a": {"b": 1}}, config)
+        await self.output.send({"a": {"b": 2}}, config)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["a"]["b"] for line in lines] == [1, 2]
+        assert len(self.output._settings) == 1
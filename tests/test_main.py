@@ -7,6 +7,8 @@
 - run_with_config 関数の動作
 """
 
+import os
+import threading
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, patch
@@ -45,6 +47,153 @@ def test_main_dependencies_import():
         pytest.fail(f"Failed to instantiate basic components: {e}")
 
 
+def test_event_loop_factory_without_uvloop():
+    """uvloop がない場合は標準のイベントループを使用することをテスト。"""
+    from src.scarfy.main import _event_loop_factory
+
+    with patch.dict("sys.modules", {"uvloop": None}):
+        assert _event_loop_factory() is None
+
+
+@pytest.mark.asyncio
+async def test_read_input_does_not_block_event_loop():
+    """入力待ちの間もイベントループが動き続けることをテスト。"""
+    from src.scarfy.main import _read_input
+
+    loop_ran = threading.Event()
+
+    def fake_input(prompt):
+        # イベントループ側の処理が進むまで入力を返さない
+        assert loop_ran.wait(timeout=2.0)
+        return "trigger"
+
+    async def other_task():
+        await asyncio.sleep(0.01)
+        loop_ran.set()
+
+    with patch("builtins.input", fake_input):
+        result, _ = await asyncio.wait_for(
+            asyncio.gather(_read_input("> "), other_task()), timeout=2.0
+        )
+
+    assert result == "trigger"
+
+
+@pytest.mark.asyncio
+async def test_read_input_propagates_eof():
+    """入力終了時にEOFErrorが送出されることをテスト。"""
+    from src.scarfy.main import _read_input
+
+    with patch("builtins.input", side_effect=EOFError):
+        with pytest.raises(EOFError):
+            await asyncio.wait_for(_read_input("> "), timeout=2.0)
+
+
+@pytest.mark.asyncio
+async def test_run_manual_mode_dispatches_commands(capsys):
+    """手動モードのコマンドがハンドラーに振り分けられることをテスト。"""
+    from src.scarfy.core.engine import ScarfyEngine
+    from src.scarfy.main import run_manual_mode
+    from src.scarfy.outputs.console import ConsoleOutput
+    from src.scarfy.triggers.manual import ManualTrigger
+
+    agent = AsyncMock()
+    agent.process.return_value = {"status": "ok"}
+    engine = ScarfyEngine()
+    engine.register_trigger("manual", ManualTrigger())
+    engine.register_agent("claude_code", agent)
+    engine.register_output("console", ConsoleOutput())
+
+    commands = iter(["help", "", "t", "unknown", "quit", "t"])
+
+    async def fake_read_input(prompt):
+        await asyncio.sleep(0.01)
+        return next(commands)
+
+    with patch("src.scarfy.main._read_input", fake_read_input):
+        await asyncio.wait_for(run_manual_mode(engine), timeout=2.0)
+
+    assert "Commands:" in capsys.readouterr().out
+    assert agent.process.await_count == 1
+    assert next(commands) == "t"
+
+
+@pytest.mark.asyncio
+async def test_cmd_claude_preserves_case():
+    """claudeコマンドのファイルパスとプロンプトが小文字化されないことをテスト。"""
+    from src.scarfy.main import _cmd_claude
+
+    trigger = AsyncMock()
+    engine = type("Engine", (), {"triggers": {"manual": trigger}})()
+
+    await _cmd_claude(engine, "Claude  Docs/README.md Review This 文書")
+
+    payload = trigger.trigger.await_args.args[0]
+    assert payload["file_path"] == "Docs/README.md"
+    assert payload["custom_prompt"] == "Review This 文書"
+
+
+def test_auto_trigger_shared_for_equivalent_paths(tmp_path, monkeypatch):
+    """同じディレクトリを指すパスのワークフローがトリガーを共有することをテスト。"""
+    from src.scarfy.core.engine import ScarfyEngine, Workflow
+    from src.scarfy.main import add_workflow_with_auto_trigger
+
+    (tmp_path / "watched").mkdir()
+    monkeypatch.chdir(tmp_path)
+    engine = ScarfyEngine()
+
+    for name, path in [("a", "./watched"), ("b", "watched")]:
+        add_workflow_with_auto_trigger(
+            engine,
+            Workflow(
+                name=name,
+                trigger_config={"type": "file_watcher", "path": path},
+                agent_config={"type": "echo"},
+                output_config={"type": "console"},
+            ),
+        )
+
+    assert len(engine.triggers) == 1
+    first, second = engine.workflows
+    assert first.trigger_config == second.trigger_config
+    assert first.trigger_config["path"] == os.path.realpath(tmp_path / "watched")
+
+
+def test_auto_trigger_warns_when_shared_config_differs(tmp_path, monkeypatch):
+    """トリガーを共有するワークフローの設定が異なる場合に警告することをテスト。"""
+    from src.scarfy.core.engine import ScarfyEngine, Workflow
+    from src.scarfy.main import add_workflow_with_auto_trigger
+
+    (tmp_path / "watched").mkdir()
+    monkeypatch.chdir(tmp_path)
+    engine = ScarfyEngine()
+
+    with patch("src.scarfy.main.logger") as mock_logger:
+        for name, path, patterns in [
+            ("a", "./watched", ["*.md"]),
+            ("b", "watched", ["*.md"]),
+            ("c", "watched", ["*.txt"]),
+        ]:
+            add_workflow_with_auto_trigger(
+                engine,
+                Workflow(
+                    name=name,
+                    trigger_config={
+                        "type": "file_watcher",
+                        "path": path,
+                        "filename_patterns": patterns,
+                    },
+                    agent_config={"type": "echo"},
+                    output_config={"type": "console"},
+                ),
+            )
+
+    mock_logger.warning.assert_called_once()
+    args = mock_logger.warning.call_args.args
+    assert args[1:4] == ("c", "a", "a")
+    assert args[4] == {"filename_patterns": ["*.txt"]}
+
+
 class TestMainConfigOption:
     """--config オプション関連のテストクラス。"""
 
@@ -102,6 +251,55 @@ class TestMainConfigOption:
         # 例外は投げない設計になっている
         await run_with_config(nonexistent_config)  # 正常に完了すべき
 
+    @pytest.mark.asyncio
+    async def test_run_with_config_loads_files_off_loop(self, tmp_path) -> None:
+        """設定とプロンプトを非同期版のローダーで読み込むことをテスト。"""
+        from src.scarfy.config.loader import ConfigLoader
+        from src.scarfy.main import run_with_config
+
+        config_file = tmp_path / "config.yaml"
+        config = {
+            "workflows": [
+                {
+                    "name": "review",
+                    "trigger": {"type": "manual"},
+                    "agent": {"type": "echo", "prompt_file": "prompt.md"},
+                    "output": {"type": "console"},
+                }
+            ]
+        }
+
+        mock_engine = AsyncMock()
+        with (
+            patch.object(
+                ConfigLoader, "load_config", side_effect=AssertionError("sync")
+            ),
+            patch.object(
+                ConfigLoader,
+                "load_prompt_from_file",
+                side_effect=AssertionError("sync"),
+            ),
+            patch.object(
+                ConfigLoader,
+                "load_config_async",
+                return_value=config,
+            ) as mock_load_config,
+            patch.object(
+                ConfigLoader,
+                "load_prompt_from_file_async",
+                return_value="Review {file_path}",
+            ) as mock_load_prompt,
+            patch("src.scarfy.main._build_default_engine", return_value=mock_engine),
+            patch("src.scarfy.main.add_workflow_with_auto_trigger") as mock_add,
+        ):
+            await run_with_config(str(config_file))
+
+        mock_load_config.assert_awaited_once()
+        mock_load_prompt.assert_awaited_once()
+        workflow = mock_add.call_args.args[1]
+        assert workflow.agent_config["prompt"] == "Review {file_path}"
+        mock_engine.start.assert_awaited_once()
+
     def test_command_line_argument_parsing(self) -> None:
         """コマンドライン引数の解析テスト。"""
         # 引数解析のテストは実装後に追加予定
@@ -0,0 +1,183 @@
+"""FileChangeHandlerクラスのテストモジュール。
+
+ファイル名パターンと一時ファイルの除外判定のテストを提供します。
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import fnmatch
+
+from watchdog.events import (
+    DirCreatedEvent,
+    DirModifiedEvent,
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+)
+
+from src.scarfy.triggers.file_watcher import FileChangeHandler, _GlobMatcher
+
+
+def make_handler(**config):
+    """テスト用のFileChangeHandlerを作成する。"""
+    return FileChangeHandler(Mock(), config, Mock())
+
+
+class TestFileChangeHandler:
+    """FileChangeHandlerクラスのテストケース。"""
+
+    def test_temp_files_are_ignored(self):
+        """デフォルトの一時ファイルパターンが除外されることをテスト。"""
+        handler = make_handler()
+
+        assert not handler._should_process_file("/watch/.#notes.md")
+        assert not handler._should_process_file("/watch/draft.md~")
+        assert not handler._should_process_file("/watch/sub/file.swp")
+        assert handler._should_process_file("/watch/notes.md")
+
+    def test_filename_patterns(self):
+        """ファイル名パターンにマッチするファイルだけが対象になることをテスト。"""
+        handler = make_handler(filename_patterns=["*.md", "report_*.txt"])
+
+        assert handler._should_process_file("/watch/notes.md")
+        assert handler._should_process_file("/watch/report_2024.txt")
+        assert not handler._should_process_file("/watch/other.txt")
+        # パターンはディレクトリ部分ではなくファイル名に対して照合する
+        assert not handler._should_process_file("/watch/x.md/file.py")
+
+    def test_empty_ignore_patterns(self):
+        """除外パターンが空の場合は一時ファイルも対象になることをテスト。"""
+        handler = make_handler(ignore_temp_files=[])
+
+        assert handler._should_process_file("/watch/file.tmp")
+
+    def test_dispatch_schedules_watched_events(self):
+        """監視対象のイベントタイプだけがスケジュールされることをテスト。"""
+        handler = make_handler(watch_events=["modified"])
+        handler._schedule_debounced_event = Mock()
+
+        handler.dispatch(FileCreatedEvent("/watch/new.md"))
+        handler.dispatch(DirModifiedEvent("/watch/sub"))
+        handler.dispatch(FileDeletedEvent("/watch/old.md"))
+        handler.dispatch(FileModifiedEvent("/watch/notes.md"))
+
+        handler._schedule_debounced_event.assert_called_once_with(
+            "file_modified", "/watch/notes.md"
+        )
+
+    def test_event_filter_follows_watch_events(self):
+        """Observerに渡すイベントフィルターが監視対象と一致することをテスト。"""
+        default = make_handler()
+        modified_only = make_handler(watch_events=["modified"], recursive=True)
+
+        assert default.event_filter == [FileCreatedEvent, FileModifiedEvent]
+        # 再帰監視では新しいサブディレクトリの検出に作成イベントを残す
+        assert modified_only.event_filter == [FileModifiedEvent, DirCreatedEvent]
+
+
+def test_glob_matcher_agrees_with_fnmatch():
+    """_GlobMatcher の判定が fnmatch と一致することをテスト。"""
+    patterns = ["*.tmp", "~*", ".DS_Store", "#*#", "*~", "a?c", "[ab]*.md", "*", ""]
+    names = ["x.tmp", ".tmp", "~lock", ".DS_Store", "#a#", "b~", "abc", "bx.md", ""]
+
+    for pattern in patterns:
+        matcher = _GlobMatcher([pattern])
+        for name in names:
+            assert matcher.matches(name) == fnmatch.fnmatch(name, pattern), (
+                pattern,
+                name,
+            )
+
+
+class TestFileChangeHandlerDebounce:
+    """FileChangeHandlerのデバウンス処理のテストケース。"""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_published_once_with_last_action(self):
+        """短時間の連続イベントが最後のアクションで1回だけ発行されることをテスト。"""
+        event_bus = Mock()
+        event_bus.publish = AsyncMock()
+        handler = FileChangeHandler(
+            event_bus, {"debounce_delay": 0.05}, asyncio.get_running_loop()
+        )
+
+        def burst():
+            handler._schedule_debounced_event("file_created", "/watch/a.md")
+            handler._schedule_debounced_event("file_modified", "/watch/b.md")
+            handler._schedule_debounced_event("file_modified", "/watch/a.md")
+
+        # watchdog と同じく別スレッドから呼び出す
+        thread = threading.Thread(target=burst)
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.2)
+
+        published = [call.args[0].data for call in event_bus.publish.await_args_list]
+        assert [(d["file_path"], d["action"]) for d in published] == [
+            ("/watch/b.md", "file_modified"),
+            ("/watch/a.md", "file_modified"),
+        ]
+        assert handler._debounce_task is None
+
+    @pytest.mark.asyncio
+    async def test_cleanup_discards_pending_events(self):
+        """クリーンアップで保留中のイベントが破棄されることをテスト。"""
+        event_bus = Mock()
+        event_bus.publish = AsyncMock()
+        handler = FileChangeHandler(
+            event_bus, {"debounce_delay": 0.05}, asyncio.get_running_loop()
+        )
+
+        handler._schedule_debounced_event("file_modified", "/watch/a.md")
+        await asyncio.sleep(0)
+        await handler.cleanup()
+        handler._schedule_debounced_event("file_modified", "/watch/b.md")
+        await asyncio.sleep(0.1)
+
+        event_bus.publish.assert_not_awaited()
+        assert handler._debounce_task is None
+
+    @pytest.mark.asyncio
+    async def test_zero_delay_publishes_every_event(self):
+        """遅延0の場合はデバウンスせずに各イベントが発行されることをテスト。"""
+        event_bus = Mock()
+        event_bus.publish = AsyncMock()
+        handler = FileChangeHandler(
+            event_bus, {"debounce_delay": 0}, asyncio.get_running_loop()
+        )
+
+        def burst():
+            handler._schedule_debounced_event("file_created", "/watch/a.md")
+            handler._schedule_debounced_event("file_modified", "/watch/a.md")
+
+        thread = threading.Thread(target=burst)
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0.05)
+
+        published = [call.args[0].data for call in event_bus.publish.await_args_list]
+        assert [d["action"] for d in published] == ["file_created", "file_modified"]
+        assert handler._debounce_task is None
+
+    @pytest.mark.asyncio
+    async def test_published_event_data(self):
+        """発行されるイベントにファイル情報が含まれることをテスト。"""
+        event_bus = Mock()
+        event_bus.publish = AsyncMock()
+        handler = FileChangeHandler(event_bus, {}, asyncio.get_running_loop())
+
+        await handler._publish_event("file_created", "/watch/docs/report.tar.gz")
+
+        event = event_bus.publish.await_args.args[0]
+        assert event.type == "file_change"
+        assert event.data == {
+            "action": "file_created",
+            "file_path": "/watch/docs/report.tar.gz",
+            "file_name": "report.tar.gz",
+            "file_extension": ".gz",
+            "parent_directory": "/watch/docs",
+        }
@@ -125,6 +125,19 @@ class TestFileOperations:
         assert isinstance(result, str)
         assert "ファイル情報の取得に失敗しました" in result
 
+    def test_validate_file_uses_given_stat(self, tmp_path):
+        """取得済みのstat結果が渡された場合は再取得しないことをテスト。"""
+        file_path = tmp_path / "large.txt"
+        file_path.write_text("x" * 100)
+        file_stat = file_path.stat()
+        config = {"max_file_size": 50}
+
+        with patch.object(Path, "stat", side_effect=AssertionError("stat called")):
+            result = self.file_ops.validate_file(file_path, config, file_stat)
+
+        assert isinstance(result, str)
+        assert "ファイルサイズが制限を超えています" in result
+
     def test_read_file_safe_success(self):
         """ファイル読み込みの正常ケースをテスト。"""
         content = "Hello, World!\\nThis is a test file.\\n日本語テスト"
@@ -146,6 +159,15 @@ class TestFileOperations:
         finally:
             os.unlink(temp_file_path)
 
+    def test_read_file_safe_normalizes_newlines(self, tmp_path):
+        """改行コードがテキストモードと同じく統一されることをテスト。"""
+        file_path = tmp_path / "crlf.txt"
+        file_path.write_bytes("一行目\r\n二行目\r三行目\n".encode("utf-8"))
+
+        result = self.file_ops.read_file_safe(file_path)
+
+        assert result == "一行目\n二行目\n三行目\n"
+
     def test_read_file_safe_unicode_error(self):
         """UnicodeDecodeErrorの処理をテスト。"""
         # バイナリデータでファイルを作成
@@ -290,3 +312,14 @@ class TestFileOperations:
         assert result["output_path"] == expected_output_path
         assert result["output_name"] == "README_updated"
         assert result["output_basename"] == "README_updated"
+
+    def test_calculate_output_paths_matches_path_semantics(self):
+        """相対パスや末尾ドットの扱いがPathと一致することをテスト。"""
+        config = {"output_suffix": "_s"}
+
+        relative = self.file_ops.calculate_output_paths("docs//notes.md", config)
+        trailing_dot = self.file_ops.calculate_output_paths("/data/file.", config)
+
+        assert relative["output_path"] == str(Path("docs/notes_s.md").absolute())
+        assert relative["output_dir"] == str(Path("docs").absolute())
+        assert trailing_dot["output_name"] == "file._s"
@@ -0,0 +1,80 @@
+"""dumps_json関数のテストモジュール。
+
+orjson の有無にかかわらず同じ内容のJSONが得られることをテストします。
+"""
+
+import json
+from datetime import datetime
+from enum import Enum
+from unittest.mock import patch
+
+import pytest
+
+from src.scarfy.utils import json_encoder
+from src.scarfy.utils.json_encoder import dumps_json
+
+DATA = {
+    "message": "日本語",
+    "count": 3,
+    "timestamp": datetime(2024, 1, 1, 12, 0, 0),
+    "nested": {"items": [1, 2]},
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_same_content(use_orjson):
+    """orjson の有無で同じ内容にデコードされることをテスト。"""
+    if use_orjson and json_encoder.orjson is None:
+        pytest.skip("orjson がインストールされていません")
+    orjson_module = json_encoder.orjson if use_orjson else None
+
+    with patch.object(json_encoder, "orjson", orjson_module):
+        compact = dumps_json(DATA)
+        pretty = dumps_json(DATA, pretty=True)
+
+    expected = {**DATA, "timestamp": "2024-01-01 12:00:00"}
+    assert json.loads(compact) == expected
+    assert json.loads(pretty) == expected
+    assert "日本語" in compact
+    assert "\n" not in compact
+    assert '\n  "message": "日本語"' in pretty
+
+
+class Color(Enum):
+    """テスト用の列挙型。"""
+
+    RED = 1
+
+
+def test_dumps_json_text_format():
+    """orjson の有無による出力文字列の違いがコンパクト出力の空白だけであることをテスト。"""
+    data = {"a": 1, "b": [1, 2]}
+
+    with patch.object(json_encoder, "orjson", None):
+        # 標準jsonのコンパクト出力は json.dumps の既定の区切り文字のまま
+        assert dumps_json(data) == '{"a": 1, "b": [1, 2]}'
+        pretty = dumps_json(DATA, pretty=True)
+
+    if json_encoder.orjson is None:
+        pytest.skip("orjson がインストールされていません")
+    assert dumps_json(data) == '{"a":1,"b":[1,2]}'
+    assert dumps_json(DATA, pretty=True) == pretty
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_json_enum_and_non_finite_match_stdlib(use_orjson):
+    """Enum と非有限小数が標準jsonと同じ文字列になることをテスト。"""
+    if use_orjson and json_encoder.orjson is None:
+        pytest.skip("orjson がインストールされていません")
+    orjson_module = json_encoder.orjson if use_orjson else None
+    data = {"a": 1, "n": float("nan"), "e": [Color.RED]}
+
+    with patch.object(json_encoder, "orjson", orjson_module):
+        assert dumps_json(data) == '{"a": 1, "n": NaN, "e": ["Color.RED"]}'
+
+
+def test_dumps_json_falls_back_for_unsupported_values():
+    """orjson が扱えない値でも変換できることをテスト。"""
+    data = {"big": 2**70, 1: "int key"}
+
+    assert json.loads(dumps_json(data)) == {"big": 2**70, "1": "int key"}
@@ -0,0 +1,19 @@
+"""ロギング設定のテストモジュール。
+
+バックグラウンドの書き出しスレッドの停止と再開のテストを提供します。
+"""
+
+from src.scarfy.utils import logger as logger_module
+
+
+def test_stop_listener_resets_and_restarts():
+    """停止後に _listener が None に戻り、再度開始できることをテスト。"""
+    logger_module._ensure_listener()
+
+    logger_module._stop_listener()
+    assert logger_module._listener is None
+    # 二重停止は何もしない
+    logger_module._stop_listener()
+
+    logger_module._ensure_listener()
+    assert logger_module._listener is not None
@@ -1,5 +1,7 @@
 """MCPToolsManager の MCP サーバー自動設定機能のテスト。"""
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, AsyncMock
 from typing import List
@@ -7,6 +9,14 @@ from typing import List
 from src.scarfy.utils.mcp_tools import MCPToolsManager, MCPServerCommandError
 
 
+@pytest.fixture(autouse=True)
+def clear_configured_cache():
+    """テスト間でサーバー設定確認のキャッシュを共有しないようにする。"""
+    MCPToolsManager.invalidate_cache()
+    yield
+    MCPToolsManager.invalidate_cache()
+
+
 class TestMCPToolsManagerEnsure:
     """MCPToolsManager の自動設定機能テスト。"""
 
@@ -134,6 +144,29 @@ class TestMCPToolsManagerEnsure:
             }
             assert result == expected
 
+    @pytest.mark.asyncio
+    async def test_ensure_servers_configured_checks_concurrently(self):
+        """複数サーバーの設定確認が並行して実行されることをテスト。"""
+        server_names = ["server-a", "server-b", "server-c"]
+        running = 0
+        max_running = 0
+
+        async def slow_is_configured(server_name: str) -> bool:
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        with patch.object(
+            MCPToolsManager, "is_server_configured", side_effect=slow_is_configured
+        ):
+            result = await MCPToolsManager.ensure_servers_configured(server_names)
+
+        assert result == {name: True for name in server_names}
+        assert max_running == len(server_names)
+
 
 class TestMCPToolsManagerServerCheck:
     """MCPToolsManager のサーバー状態確認機能テスト。"""
@@ -168,6 +201,38 @@ class TestMCPToolsManagerServerCheck:
 
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_is_server_configured_uses_cache(self):
+        """2回目以降の確認ではサブプロセスを起動しないことをテスト。"""
+        mock_process = AsyncMock()
+        mock_process.communicate.return_value = (b"server config", b"")
+        mock_process.returncode = 0
+
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=mock_process
+        ) as mock_exec:
+            assert await MCPToolsManager.is_server_configured("cached-server")
+            assert await MCPToolsManager.is_server_configured("cached-server")
+            assert mock_exec.call_count == 1
+
+            MCPToolsManager.invalidate_cache("cached-server")
+            assert await MCPToolsManager.is_server_configured("cached-server")
+            assert mock_exec.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_is_server_configured_after_add_server(self):
+        """追加に成功したサーバーは確認なしで設定済みと判定されることをテスト。"""
+        mock_process = AsyncMock()
+        mock_process.communicate.return_value = (b"Server added", b"")
+        mock_process.returncode = 0
+
+        with patch(
+            "asyncio.create_subprocess_exec", return_value=mock_process
+        ) as mock_exec:
+            await MCPToolsManager.add_server("new-server", ["cmd"])
+            assert await MCPToolsManager.is_server_configured("new-server")
+            assert mock_exec.call_count == 1
+
     @pytest.mark.asyncio
     async def test_is_server_configured_exception(self):
         """コマンド実行例外時の処理テスト。"""
@@ -242,3 +307,14 @@ class TestMCPToolsManagerServerAdd:
             assert exc_info.value.server_name == server_name
             assert exc_info.value.command == command
             assert exc_info.value.stderr == "システムエラー: System error"
+
+
+def test_get_tools_for_servers_preserves_order():
+    """ツール一覧が重複を除いて指定順に並ぶことをテスト。"""
+    with patch.dict(
+        "src.scarfy.utils.mcp_tools.MCP_TOOLS_MAP",
+        {"first": ["b", "a"], "second": ["a", "c"]},
+    ):
+        tools = MCPToolsManager.get_tools_for_servers(["first", "second", "first"])
+
+    assert tools == ["b", "a", "c"]
@@ -68,6 +68,18 @@ class TestTemplateEngine:
 
         assert result == "Hello world"
 
+    def test_replace_placeholders_reuses_template_with_different_contexts(self):
+        """同じテンプレートを異なるコンテキストで繰り返し置換できることをテスト。"""
+        template = "{greeting} {name}!"
+
+        first = self.engine.replace_placeholders(
+            template, {"greeting": "Hello", "name": "Alice"}
+        )
+        second = self.engine.replace_placeholders(template, {"name": "Bob"})
+
+        assert first == "Hello Alice!"
+        assert second == "{MISSING:greeting} Bob!"
+
     def test_build_context_basic(self):
         """基本的なコンテキスト構築をテスト。"""
         # 実際のEventオブジェクトを作成